@@ -0,0 +1,44 @@
+"""Store session_moves.classification as a native enum.
+
+Revision ID: 20261016_01
+Revises: 20260401_01
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_01"
+down_revision = "20260401_01"
+branch_labels = None
+depends_on = None
+
+MOVE_CLASSIFICATIONS = ("best", "excellent", "good", "inaccuracy", "mistake", "blunder")
+
+
+def upgrade() -> None:
+    move_classification = postgresql.ENUM(*MOVE_CLASSIFICATIONS, name="move_classification")
+    move_classification.create(op.get_bind(), checkfirst=True)
+    op.alter_column(
+        "session_moves",
+        "classification",
+        type_=move_classification,
+        existing_type=sa.String(length=20),
+        existing_nullable=True,
+        postgresql_using="classification::move_classification",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "session_moves",
+        "classification",
+        type_=sa.String(length=20),
+        existing_type=postgresql.ENUM(*MOVE_CLASSIFICATIONS, name="move_classification"),
+        existing_nullable=True,
+        postgresql_using="classification::text",
+    )
+    postgresql.ENUM(name="move_classification").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,41 @@
+"""Add covering indexes for the history and session analysis queries.
+
+Revision ID: 20261016_02
+Revises: 20261016_01
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261016_02"
+down_revision = "20261016_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Covers GET /api/history:
+    #   WHERE user_id = :user_id AND status = 'ended' ORDER BY ended_at DESC LIMIT :limit
+    op.create_index(
+        "idx_game_sessions_history",
+        "game_sessions",
+        ["user_id", "status", sa.text("ended_at DESC")],
+        postgresql_include=["id", "started_at", "result", "engine_elo", "player_color"],
+    )
+
+    # Composite index serving the per-session classification counts;
+    # supersedes the single-column session index.
+    op.create_index(
+        "idx_session_moves_session_classification",
+        "session_moves",
+        ["session_id", "classification"],
+    )
+    op.drop_index("idx_session_moves_session", table_name="session_moves")
+
+
+def downgrade() -> None:
+    op.create_index("idx_session_moves_session", "session_moves", ["session_id"])
+    op.drop_index("idx_session_moves_session_classification", table_name="session_moves")
+    op.drop_index("idx_game_sessions_history", table_name="game_sessions")
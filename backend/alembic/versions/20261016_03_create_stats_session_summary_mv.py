@@ -0,0 +1,51 @@
+"""Create materialized view of per-user session aggregates for stats summary.
+
+One row per (user_id, window_days, player_color, status, result) for each
+supported stats window.  Refreshed out of band with
+scripts/refresh_stats_summary.py; GET /api/stats/summary reads it when
+STATS_SUMMARY_MV=true.
+
+Revision ID: 20261016_03
+Revises: 20261016_02
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261016_03"
+down_revision = "20261016_02"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # result is coalesced to '' so the unique index (required for
+    # REFRESH ... CONCURRENTLY) never has to compare NULLs.
+    op.execute("""
+        CREATE MATERIALIZED VIEW stats_session_summary_mv AS
+        SELECT
+            gs.user_id,
+            w.window_days,
+            gs.player_color,
+            gs.status,
+            COALESCE(gs.result, '') AS result,
+            COUNT(*) AS games,
+            COUNT(*) FILTER (WHERE gs.status = 'ended' AND gs.ended_at IS NOT NULL) AS timed_games,
+            SUM(EXTRACT(EPOCH FROM gs.ended_at) - EXTRACT(EPOCH FROM gs.started_at))
+                FILTER (WHERE gs.status = 'ended' AND gs.ended_at IS NOT NULL) AS duration_seconds,
+            now() AS generated_at
+        FROM game_sessions gs
+        JOIN (VALUES (0), (7), (30), (90), (365)) AS w(window_days)
+          ON w.window_days = 0
+          OR gs.started_at >= now() - make_interval(days => w.window_days)
+        GROUP BY gs.user_id, w.window_days, gs.player_color, gs.status, COALESCE(gs.result, '')
+    """)
+    op.execute("""
+        CREATE UNIQUE INDEX uq_stats_session_summary_mv
+        ON stats_session_summary_mv (user_id, window_days, player_color, status, result)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS stats_session_summary_mv")
@@ -0,0 +1,38 @@
+"""Add blunder indexes for the stats summary library section.
+
+Revision ID: 20261016_04
+Revises: 20261016_03
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261016_04"
+down_revision = "20261016_03"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Covers top_costly_blunders:
+    #   WHERE user_id = :user_id ORDER BY eval_loss_cp DESC, created_at DESC LIMIT 5
+    op.create_index(
+        "idx_blunders_user_costly",
+        "blunders",
+        ["user_id", sa.text("eval_loss_cp DESC"), sa.text("created_at DESC")],
+        postgresql_include=["id", "bad_move_san", "best_move_san"],
+    )
+
+    # Covers new_blunders_in_window: WHERE user_id = :user_id AND created_at >= :cutoff
+    op.create_index("idx_blunders_user_created", "blunders", ["user_id", "created_at"])
+
+    # Superseded by the user-leading composites above
+    op.drop_index("idx_blunders_user", table_name="blunders")
+
+
+def downgrade() -> None:
+    op.create_index("idx_blunders_user", "blunders", ["user_id"])
+    op.drop_index("idx_blunders_user_created", table_name="blunders")
+    op.drop_index("idx_blunders_user_costly", table_name="blunders")
@@ -0,0 +1,80 @@
+"""Rehash positions.fen_hash from SHA256 to BLAKE2b-128.
+
+Revision ID: 20261016_05
+Revises: 20261016_04
+Create Date: 2026-10-16
+
+"""
+import hashlib
+
+import chess
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261016_05"
+down_revision = "20261016_04"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 5000
+
+
+def _normalize_fen(fen: str) -> str:
+    # Frozen copy of app.fen.normalize_fen as of this revision, so later
+    # changes to the application's normalization cannot change what this
+    # migration computes. Keeps the first four FEN fields and only keeps the
+    # en passant square when an en passant capture is legal.
+    parts = fen.split(" ")
+    board = chess.Board(fen)
+    parts[3] = chess.square_name(board.ep_square) if board.has_legal_en_passant() else "-"
+    return " ".join(parts[:4])
+
+
+def _blake2b_128(normalized: str) -> str:
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+
+def _sha256(normalized: str) -> str:
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+def _rehash_positions(hash_fn) -> None:
+    # Old and new digests differ in length, so rewriting rows one batch at a
+    # time never trips uq_positions_user_fen_hash mid-migration.
+    bind = op.get_bind()
+    positions = sa.table(
+        "positions",
+        sa.column("id", sa.BigInteger),
+        sa.column("fen_hash", sa.String),
+        sa.column("fen_raw", sa.Text),
+    )
+    update = (
+        positions.update()
+        .where(positions.c.id == sa.bindparam("b_id"))
+        .values(fen_hash=sa.bindparam("b_hash"))
+    )
+
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.select(positions.c.id, positions.c.fen_raw)
+            .where(positions.c.id > last_id)
+            .order_by(positions.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        bind.execute(
+            update,
+            [{"b_id": row.id, "b_hash": hash_fn(_normalize_fen(row.fen_raw))} for row in rows],
+        )
+        last_id = rows[-1].id
+
+
+def upgrade() -> None:
+    _rehash_positions(_blake2b_128)
+
+
+def downgrade() -> None:
+    _rehash_positions(_sha256)
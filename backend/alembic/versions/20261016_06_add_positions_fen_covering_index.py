@@ -0,0 +1,33 @@
+"""Add covering index for position lookups by fen_hash.
+
+Revision ID: 20261016_06
+Revises: 20261016_05
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261016_06"
+down_revision = "20261016_05"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Covers the ghost-move and blunder-upsert lookups:
+    #   SELECT id FROM positions WHERE user_id = :user_id AND fen_hash = :fen_hash
+    op.create_index(
+        "idx_positions_user_fen_covering",
+        "positions",
+        ["user_id", "fen_hash"],
+        postgresql_include=["id"],
+    )
+
+    # Leading column of uq_positions_user_fen_hash and the index above.
+    op.drop_index("idx_positions_user", table_name="positions")
+
+
+def downgrade() -> None:
+    op.create_index("idx_positions_user", "positions", ["user_id"])
+    op.drop_index("idx_positions_user_fen_covering", table_name="positions")
@@ -0,0 +1,26 @@
+"""Drop the unused idx_blunders_due index.
+
+Revision ID: 20261016_07
+Revises: 20261016_06
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261016_07"
+down_revision = "20261016_06"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Due-ness is priority = hours_since_review / expected_interval_hours(pass_streak)
+    # (app/srs_math.py), evaluated in Python; no query filters blunders on
+    # pass_streak or last_reviewed_at, so this index only costs writes.
+    # Per-user blunder scans use idx_blunders_user_created / idx_blunders_user_costly.
+    op.drop_index("idx_blunders_due", table_name="blunders")
+
+
+def downgrade() -> None:
+    op.create_index("idx_blunders_due", "blunders", ["user_id", "pass_streak", "last_reviewed_at"])
@@ -0,0 +1,40 @@
+"""Store positions.fen_hash as a raw 16-byte BYTEA digest.
+
+Revision ID: 20261016_08
+Revises: 20261016_07
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261016_08"
+down_revision = "20261016_07"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Values are 32-char BLAKE2b-128 hex digests since 20261016_05.
+    # uq_positions_user_fen_hash and idx_positions_user_fen_covering are
+    # rebuilt by the type change.
+    op.alter_column(
+        "positions",
+        "fen_hash",
+        existing_type=sa.String(length=64),
+        type_=sa.LargeBinary(length=16),
+        existing_nullable=False,
+        postgresql_using="decode(fen_hash, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "positions",
+        "fen_hash",
+        existing_type=sa.LargeBinary(length=16),
+        type_=sa.String(length=64),
+        existing_nullable=False,
+        postgresql_using="encode(fen_hash, 'hex')",
+    )
@@ -0,0 +1,36 @@
+"""Cover the ghost-candidate blunder join with an INCLUDE index.
+
+Revision ID: 20261016_09
+Revises: 20261016_08
+Create Date: 2026-10-16
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261016_09"
+down_revision = "20261016_08"
+branch_labels = None
+depends_on = None
+
+_CANDIDATE_COLUMNS = ["id", "eval_loss_cp", "pass_streak", "last_reviewed_at", "created_at"]
+
+
+def upgrade() -> None:
+    # Covers the ghost-move candidate join in the steering CTE:
+    #   JOIN blunders b ON b.position_id = r.position_id WHERE b.user_id = :user_id
+    # which reads only the SRS/scoring columns, so the probe is index-only.
+    op.create_index(
+        "idx_blunders_position_user_covering",
+        "blunders",
+        ["position_id", "user_id"],
+        postgresql_include=_CANDIDATE_COLUMNS,
+    )
+
+    # Same key columns as the covering index above.
+    op.drop_index("idx_blunders_position_user", table_name="blunders")
+
+
+def downgrade() -> None:
+    op.create_index("idx_blunders_position_user", "blunders", ["position_id", "user_id"])
+    op.drop_index("idx_blunders_position_user_covering", table_name="blunders")
@@ -141,7 +141,7 @@ def claim(
             detail="Invalid or expired token",
         )
 
-    user = db.query(User).filter(User.id == payload.user_id).first()
+    user = db.get(User, payload.user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -17,13 +17,15 @@ import chess
 import chess.pgn
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 
 from app.db import get_db
 from app.fen import active_color, fen_hash, normalize_fen
+from app.ghost_position_cache import add_user_positions
 from app.models import Blunder, BlunderReview, GameSession, Move, Position
 from app.security import TokenPayload, get_current_user
-from app.srs_math import calculate_priority
+from app.srs_math import calculate_priorities
+from app.stats_summary_cache import invalidate_user_summaries
 
 router = APIRouter(prefix="/api/blunder", tags=["blunder"])
 AUTO_RECORDING_MAX_FULL_MOVES = 10
@@ -67,10 +69,10 @@ class BlunderResponse(BaseModel):
 
 @dataclass
 class ReplayData:
-    positions_data: list[tuple[str, str, str]]  # (fen, hash, active_color)
-    moves_data: list[tuple[str, str, str]]  # (from_hash, move_san, to_hash)
+    positions_data: list[tuple[str, bytes, str]]  # (fen, hash, active_color)
+    moves_data: list[tuple[bytes, str, bytes]]  # (from_hash, move_san, to_hash)
     pre_move_fen_raw: str
-    pre_move_hash: str
+    pre_move_hash: bytes
     pre_move_color: str
 
 
@@ -78,7 +80,7 @@ def _get_session_or_404(
     db: Session,
     session_id: uuid.UUID,
 ) -> GameSession:
-    session = db.query(GameSession).filter(GameSession.id == session_id).first()
+    session = db.get(GameSession, session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Game session not found")
     return session
@@ -109,8 +111,8 @@ def _replay_pgn(
         raise HTTPException(status_code=422, detail="Invalid PGN format")
 
     board = game.board()
-    positions_data: list[tuple[str, str, str]] = []
-    moves_data: list[tuple[str, str, str]] = []
+    positions_data: list[tuple[str, bytes, str]] = []
+    moves_data: list[tuple[bytes, str, bytes]] = []
 
     start_fen = board.fen()
     positions_data.append((start_fen, fen_hash(start_fen), active_color(start_fen)))
@@ -135,7 +137,11 @@ def _replay_pgn(
             )
 
     pre_move_fen_raw, pre_move_hash, pre_move_color = positions_data[-2]
-    if normalize_fen(pre_move_fen_raw) != normalize_fen(request_fen):
+    try:
+        normalized_request_fen = normalize_fen(request_fen)
+    except ValueError:
+        raise HTTPException(status_code=422, detail="Invalid FEN")
+    if normalize_fen(pre_move_fen_raw) != normalized_request_fen:
         raise HTTPException(
             status_code=422,
             detail="Pre-move FEN mismatch: position does not match PGN",
@@ -154,19 +160,19 @@ def _upsert_positions(
     db: Session,
     *,
     user_id: int,
-    positions_data: list[tuple[str, str, str]],
-) -> tuple[dict[str, int], int]:
-    hash_to_position_id: dict[str, int] = {}
-    positions_created = 0
+    positions_data: list[tuple[str, bytes, str]],
+) -> tuple[dict[bytes, int], list[tuple[bytes, int, str]]]:
+    hash_to_position_id: dict[bytes, int] = {}
+    created: list[tuple[bytes, int, str]] = []
 
     for fen_raw, hash_val, color in positions_data:
-        existing = db.query(Position).filter(
+        existing_id = db.query(Position.id).filter(
             Position.user_id == user_id,
             Position.fen_hash == hash_val,
-        ).first()
+        ).scalar()
 
-        if existing:
-            hash_to_position_id[hash_val] = existing.id
+        if existing_id is not None:
+            hash_to_position_id[hash_val] = existing_id
             continue
 
         position = Position(
@@ -178,16 +184,16 @@ def _upsert_positions(
         db.add(position)
         db.flush()
         hash_to_position_id[hash_val] = position.id
-        positions_created += 1
+        created.append((hash_val, position.id, color))
 
-    return hash_to_position_id, positions_created
+    return hash_to_position_id, created
 
 
 def _upsert_moves(
     db: Session,
     *,
-    moves_data: list[tuple[str, str, str]],
-    hash_to_position_id: dict[str, int],
+    moves_data: list[tuple[bytes, str, bytes]],
+    hash_to_position_id: dict[bytes, int],
 ) -> None:
     for from_hash, move_san, to_hash in moves_data:
         from_id = hash_to_position_id[from_hash]
@@ -275,7 +281,7 @@ def _record_target(
             ),
         )
 
-    hash_to_position_id, positions_created = _upsert_positions(
+    hash_to_position_id, created_positions = _upsert_positions(
         db,
         user_id=user.user_id,
         positions_data=replay_data.positions_data,
@@ -301,10 +307,12 @@ def _record_target(
         session.blunder_recorded = True
 
     db.commit()
+    invalidate_user_summaries(user.user_id)
+    add_user_positions(user.user_id, created_positions)
     return BlunderResponse(
         blunder_id=blunder_id,
         position_id=pre_move_position_id,
-        positions_created=positions_created,
+        positions_created=len(created_positions),
         is_new=is_new,
     )
 
@@ -411,7 +419,8 @@ def list_blunders(
     """Return the authenticated user's blunders with calculated SRS priority."""
     rows: Sequence[Blunder] = (
         db.query(Blunder)
-        .join(Position, Blunder.position_id == Position.id)
+        .join(Blunder.position)
+        .options(contains_eager(Blunder.position))
         .filter(Blunder.user_id == user.user_id)
         .all()
     )
@@ -458,20 +467,16 @@ def list_blunders(
             session_ended[gs.id] = gs.ended_at
 
     now = datetime.now(timezone.utc)
+    priorities = calculate_priorities(
+        ((b.pass_streak, b.last_reviewed_at, b.created_at) for b in rows),
+        now=now,
+    )
     items: list[BlunderListItem] = []
-    for b in rows:
-        priority = calculate_priority(
-            pass_streak=b.pass_streak,
-            last_reviewed_at=b.last_reviewed_at,
-            created_at=b.created_at,
-            now=now,
-        )
+    for b, priority in zip(rows, priorities):
         if due and priority <= 1.0:
             continue
 
-        position: Position | None = (
-            db.query(Position).filter(Position.id == b.position_id).first()
-        )
+        position = b.position
 
         # Prefer the most recent review session, fall back to source session
         review = latest_reviews.get(b.id)
@@ -488,7 +493,7 @@ def list_blunders(
         items.append(
             BlunderListItem(
                 id=b.id,
-                fen=position.fen_raw if position else "",
+                fen=position.fen_raw,
                 bad_move=b.bad_move_san,
                 best_move=b.best_move_san,
                 eval_loss_cp=b.eval_loss_cp,
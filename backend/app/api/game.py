@@ -6,17 +6,23 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from pydantic import BaseModel, Field
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.db import get_db
 from app.fen import fen_hash, active_color
+from app.ghost_position_cache import (
+    drop_session_positions,
+    get_cached_position_id,
+    warm_session_positions,
+)
 from app.models import GameSession, Position, RatingHistory
 from app.rating import DEFAULT_RATING, RESULT_SCORES, compute_new_rating
 from app.security import TokenPayload, get_current_user
-from app.srs_math import calculate_priority, calculate_urgency
+from app.srs_math import calculate_priorities, calculate_urgency
+from app.stats_summary_cache import invalidate_user_summaries
 
 router = APIRouter(prefix="/api/game", tags=["game"])
 
@@ -54,7 +60,7 @@ def _stable_seed(user_id: int, fen: str, session_id: uuid.UUID) -> int:
     Uses fen_hash (normalized position identity) so equivalent FENs that
     differ only in halfmove/fullmove counters produce the same seed.
     """
-    raw = f"{user_id}|{fen_hash(fen)}|{session_id}".encode()
+    raw = f"{user_id}|{fen_hash(fen).hex()}|{session_id}".encode()
     return int.from_bytes(hashlib.sha256(raw).digest()[:8], byteorder="big")
 
 
@@ -91,17 +97,22 @@ def find_ghost_move(
         Tuple of (move_san, target_blunder_id, last_reviewed_at, created_at) if ghost path exists,
         else (None, None, None, None)
     """
-    # Look up current position by FEN hash
-    current_position = (
-        db.query(Position)
-        .filter(
-            Position.user_id == user_id,
-            Position.fen_hash == fen_hash(fen),
-        )
-        .first()
+    # Look up current position by FEN hash, preferring the per-session cache
+    current_hash = fen_hash(fen)
+    start_position_id = (
+        get_cached_position_id(session_id, current_hash) if session_id is not None else None
     )
+    if start_position_id is None:
+        start_position_id = (
+            db.query(Position.id)
+            .filter(
+                Position.user_id == user_id,
+                Position.fen_hash == current_hash,
+            )
+            .scalar()
+        )
 
-    if not current_position:
+    if start_position_id is None:
         return (None, None, None, None)
 
     # Recursive CTE to find candidate blunders up to the steering radius.
@@ -148,7 +159,7 @@ def find_ghost_move(
     candidate_rows = db.execute(
         cte_query,
         {
-            "start_position_id": current_position.id,
+            "start_position_id": start_position_id,
             "user_id": user_id,
             "player_color": player_color,
             "steering_radius": STEERING_RADIUS,
@@ -159,9 +170,13 @@ def find_ghost_move(
         return (None, None, None, None)
 
     now = datetime.now(timezone.utc)
+    priorities = calculate_priorities(
+        ((row[4], row[5], row[6]) for row in candidate_rows),
+        now=now,
+    )
     scored: list[tuple[GhostMoveCandidate, float]] = []
 
-    for row in candidate_rows:
+    for row, priority in zip(candidate_rows, priorities):
         candidate = GhostMoveCandidate(
             first_move=row[0],
             blunder_id=row[1],
@@ -171,12 +186,6 @@ def find_ghost_move(
             last_reviewed_at=row[5],
             created_at=row[6],
         )
-        priority = calculate_priority(
-            pass_streak=candidate.pass_streak,
-            last_reviewed_at=candidate.last_reviewed_at,
-            created_at=candidate.created_at,
-            now=now,
-        )
         if priority < 1.0:
             continue
         scored.append((candidate, candidate.score(now)))
@@ -327,6 +336,7 @@ class NextOpponentMoveResponse(BaseModel):
 @router.post("/start", response_model=GameStartResponse, status_code=201)
 def start_game(
     request: GameStartRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     user: TokenPayload = Depends(get_current_user),
 ) -> GameStartResponse:
@@ -348,6 +358,16 @@ def start_game(
     db.add(session)
     db.commit()
     db.refresh(session)
+    invalidate_user_summaries(user.user_id)
+
+    # Pre-warm ghost-move position lookups for the opponent's side to move.
+    background_tasks.add_task(
+        warm_session_positions,
+        db.get_bind(),
+        session_id=session.id,
+        user_id=user.user_id,
+        active_color="black" if request.player_color == PlayerColor.WHITE else "white",
+    )
 
     return GameStartResponse(
         session_id=session.id,
@@ -369,7 +389,7 @@ def end_game(
     Validates that the session exists, belongs to the user, and is currently active.
     """
     # Fetch the session
-    session = db.query(GameSession).filter(GameSession.id == request.session_id).first()
+    session = db.get(GameSession, request.session_id)
 
     if not session:
         raise HTTPException(status_code=404, detail="Game session not found")
@@ -426,6 +446,8 @@ def end_game(
 
     db.commit()
     db.refresh(session)
+    drop_session_positions(session.id)
+    invalidate_user_summaries(user.user_id)
 
     return GameEndResponse(
         session_id=session.id,
@@ -454,7 +476,7 @@ def get_next_opponent_move(
     4. Otherwise, fall back to backend engine inference (Maia)
     """
     # Fetch and validate session
-    session = db.query(GameSession).filter(GameSession.id == request.session_id).first()
+    session = db.get(GameSession, request.session_id)
 
     if not session:
         raise HTTPException(status_code=404, detail="Game session not found")
@@ -5,11 +5,12 @@ from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
-from sqlalchemy import case, func
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.db import get_db
 from app.models import GameSession, SessionMove
+from app.responses import ORJSONResponse
 from app.security import TokenPayload, get_current_user
 
 router = APIRouter(prefix="/api/history", tags=["history"])
@@ -42,20 +43,26 @@ def get_history(
     limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db),
     user: TokenPayload = Depends(get_current_user),
-) -> HistoryResponse:
-    sessions = (
-        db.query(GameSession)
-        .filter(
+) -> ORJSONResponse:
+    sessions = db.execute(
+        select(
+            GameSession.id,
+            GameSession.started_at,
+            GameSession.ended_at,
+            GameSession.result,
+            GameSession.engine_elo,
+            GameSession.player_color,
+        )
+        .where(
             GameSession.user_id == user.user_id,
             GameSession.status == "ended",
         )
         .order_by(GameSession.ended_at.desc())
         .limit(limit)
-        .all()
-    )
+    ).all()
 
     if not sessions:
-        return HistoryResponse(games=[])
+        return ORJSONResponse(content={"games": []})
 
     session_ids = [s.id for s in sessions]
 
@@ -63,9 +70,9 @@ def get_history(
         db.query(
             SessionMove.session_id,
             func.count().label("total_moves"),
-            func.sum(case((SessionMove.classification == "blunder", 1), else_=0)).label("blunders"),
-            func.sum(case((SessionMove.classification == "mistake", 1), else_=0)).label("mistakes"),
-            func.sum(case((SessionMove.classification == "inaccuracy", 1), else_=0)).label("inaccuracies"),
+            func.count().filter(SessionMove.classification == "blunder").label("blunders"),
+            func.count().filter(SessionMove.classification == "mistake").label("mistakes"),
+            func.count().filter(SessionMove.classification == "inaccuracy").label("inaccuracies"),
             func.avg(SessionMove.eval_delta).label("avg_cpl"),
         )
         .filter(SessionMove.session_id.in_(session_ids))
@@ -73,36 +80,40 @@ def get_history(
         .all()
     )
 
-    stats_by_session: dict[uuid.UUID, GameSummary] = {}
+    stats_by_session: dict[uuid.UUID, dict] = {}
     for row in stats_rows:
         avg_cpl = int(round(row.avg_cpl)) if row.avg_cpl is not None else 0
-        stats_by_session[row.session_id] = GameSummary(
-            total_moves=int(row.total_moves),
-            blunders=int(row.blunders or 0),
-            mistakes=int(row.mistakes or 0),
-            inaccuracies=int(row.inaccuracies or 0),
-            average_centipawn_loss=avg_cpl,
-        )
-
-    empty_summary = GameSummary(
-        total_moves=0,
-        blunders=0,
-        mistakes=0,
-        inaccuracies=0,
-        average_centipawn_loss=0,
-    )
-
-    return HistoryResponse(
-        games=[
-            HistoryGame(
-                session_id=s.id,
-                started_at=s.started_at,
-                ended_at=s.ended_at,
-                result=s.result,
-                engine_elo=s.engine_elo,
-                player_color=s.player_color,
-                summary=stats_by_session.get(s.id, empty_summary),
-            )
-            for s in sessions
-        ]
+        stats_by_session[row.session_id] = {
+            "total_moves": int(row.total_moves),
+            "blunders": int(row.blunders or 0),
+            "mistakes": int(row.mistakes or 0),
+            "inaccuracies": int(row.inaccuracies or 0),
+            "average_centipawn_loss": avg_cpl,
+        }
+
+    empty_summary = {
+        "total_moves": 0,
+        "blunders": 0,
+        "mistakes": 0,
+        "inaccuracies": 0,
+        "average_centipawn_loss": 0,
+    }
+
+    # Rows are selected as plain tuples and serialized straight to JSON;
+    # response_model only documents the shape.
+    return ORJSONResponse(
+        content={
+            "games": [
+                {
+                    "session_id": s.id,
+                    "started_at": s.started_at,
+                    "ended_at": s.ended_at,
+                    "result": s.result,
+                    "engine_elo": s.engine_elo,
+                    "player_color": s.player_color,
+                    "summary": stats_by_session.get(s.id, empty_summary),
+                }
+                for s in sessions
+            ]
+        }
     )
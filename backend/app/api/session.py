@@ -6,7 +6,7 @@ from enum import Enum
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
-from sqlalchemy import case, func
+from sqlalchemy import case, func, select
 from sqlalchemy.dialects.postgresql import insert as postgresql_insert
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
@@ -14,7 +14,9 @@ from sqlalchemy.orm import Session
 from app.db import get_db
 from app.opening_cache import recompute_opening_scores_if_needed
 from app.models import AnalysisCache, GameSession, SessionMove
+from app.responses import ORJSONResponse
 from app.security import TokenPayload, get_current_user
+from app.stats_summary_cache import invalidate_user_summaries
 
 router = APIRouter(prefix="/api/session", tags=["session"])
 logger = logging.getLogger(__name__)
@@ -106,7 +108,7 @@ class SessionAnalysisResponse(BaseModel):
 
 
 def _get_session_or_404(db: Session, session_id: uuid.UUID) -> GameSession:
-    game_session = db.query(GameSession).filter(GameSession.id == session_id).first()
+    game_session = db.get(GameSession, session_id)
     if not game_session:
         raise HTTPException(status_code=404, detail="Game session not found")
     return game_session
@@ -118,18 +120,25 @@ def _ensure_session_owned_by_user(game_session: GameSession, user: TokenPayload)
 
 
 def _validate_unique_move_keys(moves: list[SessionMoveInput]) -> None:
-    seen: set[tuple[int, str]] = set()
-    for move in moves:
-        key = (move.move_number, move.color.value)
-        if key in seen:
+    # The upsert below cannot be relied on to reject duplicates: SQLite
+    # silently applies both rows and Postgres raises a cardinality error
+    # rather than an IntegrityError.  Keep the check, but compare set size
+    # on the happy path and only walk the payload to report the offender.
+    keys = [(move.move_number, move.color) for move in moves]
+    if len(set(keys)) == len(keys):
+        return
+
+    seen: set[tuple[int, MoveColor]] = set()
+    for move_number, color in keys:
+        if (move_number, color) in seen:
             raise HTTPException(
                 status_code=422,
                 detail=(
                     "Duplicate move entry in payload for "
-                    f"move_number={move.move_number}, color={move.color.value}"
+                    f"move_number={move_number}, color={color.value}"
                 ),
             )
-        seen.add(key)
+        seen.add((move_number, color))
 
 
 def _refresh_opening_scores_best_effort(db: Session, user_id: int, player_color: str) -> None:
@@ -279,6 +288,7 @@ def upsert_session_moves(
                 db.add(SessionMove(**value))
 
         db.commit()
+        invalidate_user_summaries(user.user_id)
         _upsert_analysis_cache(db, request.moves)
         _refresh_opening_scores_best_effort(db, user.user_id, game_session.player_color)
         return SessionMovesResponse(moves_inserted=len(values))
@@ -306,6 +316,7 @@ def upsert_session_moves(
     )
     db.execute(statement)
     db.commit()
+    invalidate_user_summaries(user.user_id)
 
     _upsert_analysis_cache(db, request.moves)
     _refresh_opening_scores_best_effort(db, user.user_id, game_session.player_color)
@@ -318,29 +329,62 @@ def get_session_analysis(
     session_id: uuid.UUID,
     db: Session = Depends(get_db),
     user: TokenPayload = Depends(get_current_user),
-) -> SessionAnalysisResponse:
+) -> ORJSONResponse:
     game_session = _get_session_or_404(db, session_id)
     _ensure_session_owned_by_user(game_session, user)
 
+    # Rows are streamed as plain tuples and serialized straight to JSON;
+    # response_model only documents the shape.
     color_order = case((SessionMove.color == MoveColor.WHITE.value, 0), else_=1)
-    session_moves = (
-        db.query(SessionMove)
-        .filter(SessionMove.session_id == session_id)
+    move_rows = db.execute(
+        select(
+            SessionMove.move_number,
+            SessionMove.color,
+            SessionMove.move_san,
+            SessionMove.fen_after,
+            SessionMove.eval_cp,
+            SessionMove.eval_mate,
+            SessionMove.best_move_san,
+            SessionMove.best_move_eval_cp,
+            SessionMove.eval_delta,
+            SessionMove.classification,
+            SessionMove.fen_before,
+            SessionMove.best_move_uci,
+        )
+        .where(SessionMove.session_id == session_id)
         .order_by(SessionMove.move_number.asc(), color_order.asc())
-        .all()
+        .execution_options(yield_per=200)
     )
 
+    moves: list[dict] = []
+    position_analysis: dict[str, dict] = {}
+    for row in move_rows:
+        moves.append({
+            "move_number": row.move_number,
+            "color": row.color,
+            "move_san": row.move_san,
+            "fen_after": row.fen_after,
+            "eval_cp": row.eval_cp,
+            "eval_mate": row.eval_mate,
+            "best_move_san": row.best_move_san,
+            "best_move_eval_cp": row.best_move_eval_cp,
+            "eval_delta": row.eval_delta,
+            "classification": row.classification,
+        })
+        if row.fen_before and row.best_move_uci and row.fen_before not in position_analysis:
+            position_analysis[row.fen_before] = {
+                "best_move_uci": row.best_move_uci,
+                "best_move_san": row.best_move_san,
+                "best_move_eval_cp": row.best_move_eval_cp,
+            }
+
     summary_row = (
         db.query(
-            func.sum(case((SessionMove.classification == MoveClassification.BLUNDER.value, 1), else_=0)).label(
-                "blunders"
-            ),
-            func.sum(case((SessionMove.classification == MoveClassification.MISTAKE.value, 1), else_=0)).label(
-                "mistakes"
-            ),
-            func.sum(
-                case((SessionMove.classification == MoveClassification.INACCURACY.value, 1), else_=0)
-            ).label("inaccuracies"),
+            func.count().filter(SessionMove.classification == MoveClassification.BLUNDER.value).label("blunders"),
+            func.count().filter(SessionMove.classification == MoveClassification.MISTAKE.value).label("mistakes"),
+            func.count()
+            .filter(SessionMove.classification == MoveClassification.INACCURACY.value)
+            .label("inaccuracies"),
             func.avg(SessionMove.eval_delta).label("average_centipawn_loss"),
         )
         .filter(SessionMove.session_id == session_id)
@@ -353,15 +397,6 @@ def get_session_analysis(
         else 0
     )
 
-    position_analysis: dict[str, PositionAnalysis] = {}
-    for move in session_moves:
-        if move.fen_before and move.best_move_uci and move.fen_before not in position_analysis:
-            position_analysis[move.fen_before] = PositionAnalysis(
-                best_move_uci=move.best_move_uci,
-                best_move_san=move.best_move_san,
-                best_move_eval_cp=move.best_move_eval_cp,
-            )
-
     # Completion metadata: derive expected_total_moves from stored PGN
     expected_total_moves: int | None = None
     if game_session.pgn:
@@ -374,40 +409,28 @@ def get_session_analysis(
         except Exception:
             pass
 
-    analyzed_moves = len(session_moves)
+    analyzed_moves = len(moves)
     is_complete = (
         expected_total_moves is not None
         and analyzed_moves >= expected_total_moves
     )
 
-    return SessionAnalysisResponse(
-        session_id=game_session.id,
-        pgn=game_session.pgn,
-        result=game_session.result,
-        player_color=game_session.player_color,
-        moves=[
-            SessionAnalysisMove(
-                move_number=move.move_number,
-                color=move.color,
-                move_san=move.move_san,
-                fen_after=move.fen_after,
-                eval_cp=move.eval_cp,
-                eval_mate=move.eval_mate,
-                best_move_san=move.best_move_san,
-                best_move_eval_cp=move.best_move_eval_cp,
-                eval_delta=move.eval_delta,
-                classification=move.classification,
-            )
-            for move in session_moves
-        ],
-        summary=SessionAnalysisSummary(
-            blunders=int(summary_row.blunders or 0),
-            mistakes=int(summary_row.mistakes or 0),
-            inaccuracies=int(summary_row.inaccuracies or 0),
-            average_centipawn_loss=average_centipawn_loss,
-        ),
-        position_analysis=position_analysis,
-        expected_total_moves=expected_total_moves,
-        analyzed_moves=analyzed_moves,
-        is_complete=is_complete,
+    return ORJSONResponse(
+        content={
+            "session_id": game_session.id,
+            "pgn": game_session.pgn,
+            "result": game_session.result,
+            "player_color": game_session.player_color,
+            "moves": moves,
+            "summary": {
+                "blunders": int(summary_row.blunders or 0),
+                "mistakes": int(summary_row.mistakes or 0),
+                "inaccuracies": int(summary_row.inaccuracies or 0),
+                "average_centipawn_loss": average_centipawn_loss,
+            },
+            "position_analysis": position_analysis,
+            "expected_total_moves": expected_total_moves,
+            "analyzed_moves": analyzed_moves,
+            "is_complete": is_complete,
+        }
     )
@@ -6,6 +6,7 @@ import uuid
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 
 from app.db import get_db
@@ -17,6 +18,8 @@ from app.srs_math import calculate_priority, expected_interval_hours
 router = APIRouter(prefix="/api/srs", tags=["srs"])
 logger = logging.getLogger(__name__)
 
+MAX_BATCH_REVIEWS = 100
+
 
 class SrsReviewRequest(BaseModel):
     session_id: uuid.UUID = Field(..., description="Game session ID")
@@ -33,8 +36,16 @@ class SrsReviewResponse(BaseModel):
     next_expected_review: datetime
 
 
+class SrsReviewBatchRequest(BaseModel):
+    reviews: list[SrsReviewRequest] = Field(..., min_length=1, max_length=MAX_BATCH_REVIEWS)
+
+
+class SrsReviewBatchResponse(BaseModel):
+    reviews: list[SrsReviewResponse]
+
+
 def _get_session_or_404(db: Session, session_id: uuid.UUID) -> GameSession:
-    game_session = db.query(GameSession).filter(GameSession.id == session_id).first()
+    game_session = db.get(GameSession, session_id)
     if not game_session:
         raise HTTPException(status_code=404, detail="Game session not found")
     return game_session
@@ -46,8 +57,8 @@ def _ensure_session_owned_by_user(game_session: GameSession, user: TokenPayload)
 
 
 def _get_blunder_or_404(db: Session, *, blunder_id: int, user_id: int) -> Blunder:
-    blunder = db.query(Blunder).filter(Blunder.id == blunder_id, Blunder.user_id == user_id).first()
-    if not blunder:
+    blunder = db.get(Blunder, blunder_id)
+    if not blunder or blunder.user_id != user_id:
         raise HTTPException(status_code=404, detail="Blunder not found")
     return blunder
 
@@ -64,6 +75,39 @@ def _get_blunder_player_color(db: Session, blunder: Blunder) -> str | None:
     return db.query(Position.active_color).filter(Position.id == blunder.position_id).scalar()
 
 
+def _get_blunder_player_colors(db: Session, blunder_ids: set[int]) -> set[str]:
+    rows = (
+        db.query(GameSession.player_color, Position.active_color)
+        .select_from(Blunder)
+        .join(Position, Position.id == Blunder.position_id)
+        .outerjoin(GameSession, GameSession.id == Blunder.source_session_id)
+        .filter(Blunder.id.in_(blunder_ids))
+        .all()
+    )
+    return {source_color or position_color for source_color, position_color in rows}
+
+
+def _build_review_response(
+    *,
+    blunder_id: int,
+    pass_streak: int,
+    reviewed_at: datetime,
+    created_at: datetime | None,
+) -> SrsReviewResponse:
+    interval_hours = expected_interval_hours(pass_streak)
+    return SrsReviewResponse(
+        blunder_id=blunder_id,
+        pass_streak=pass_streak,
+        priority=calculate_priority(
+            pass_streak=pass_streak,
+            last_reviewed_at=reviewed_at,
+            created_at=created_at,
+            now=reviewed_at,
+        ),
+        next_expected_review=reviewed_at + timedelta(hours=interval_hours),
+    )
+
+
 def _refresh_opening_scores_best_effort(db: Session, user_id: int, player_color: str) -> None:
     try:
         recompute_opening_scores_if_needed(db, user_id, player_color)
@@ -109,17 +153,79 @@ def review_blunder(
     if player_color is not None:
         _refresh_opening_scores_best_effort(db, user.user_id, player_color)
 
-    interval_hours = expected_interval_hours(blunder.pass_streak)
-    next_expected_review = reviewed_at + timedelta(hours=interval_hours)
-
-    return SrsReviewResponse(
+    return _build_review_response(
         blunder_id=blunder.id,
         pass_streak=blunder.pass_streak,
-        priority=calculate_priority(
-            pass_streak=blunder.pass_streak,
-            last_reviewed_at=blunder.last_reviewed_at,
-            created_at=blunder.created_at,
-            now=reviewed_at,
-        ),
-        next_expected_review=next_expected_review,
+        reviewed_at=reviewed_at,
+        created_at=blunder.created_at,
+    )
+
+
+@router.post("/review-batch", response_model=SrsReviewBatchResponse, status_code=200)
+def review_blunders_batch(
+    request: SrsReviewBatchRequest,
+    db: Session = Depends(get_db),
+    user: TokenPayload = Depends(get_current_user),
+) -> SrsReviewBatchResponse:
+    """Apply several SRS reviews with one bulk insert and one bulk update.
+
+    Reviews are applied in payload order, so repeated reviews of the same
+    blunder chain their pass streaks exactly as sequential calls to
+    ``/review`` would.
+    """
+    session_ids = {review.session_id for review in request.reviews}
+    game_sessions = db.query(GameSession).filter(GameSession.id.in_(session_ids)).all()
+    if len(game_sessions) != len(session_ids):
+        raise HTTPException(status_code=404, detail="Game session not found")
+    for game_session in game_sessions:
+        _ensure_session_owned_by_user(game_session, user)
+
+    blunder_ids = {review.blunder_id for review in request.reviews}
+    blunders = {
+        blunder.id: blunder
+        for blunder in db.query(Blunder).filter(
+            Blunder.id.in_(blunder_ids),
+            Blunder.user_id == user.user_id,
+        )
+    }
+    if len(blunders) != len(blunder_ids):
+        raise HTTPException(status_code=404, detail="Blunder not found")
+
+    reviewed_at = datetime.now(timezone.utc)
+    pass_streaks = {blunder_id: blunder.pass_streak for blunder_id, blunder in blunders.items()}
+    review_rows: list[dict] = []
+    responses: list[SrsReviewResponse] = []
+    for review in request.reviews:
+        pass_streak = pass_streaks[review.blunder_id] + 1 if review.passed else 0
+        pass_streaks[review.blunder_id] = pass_streak
+        review_rows.append({
+            "blunder_id": review.blunder_id,
+            "session_id": review.session_id,
+            "reviewed_at": reviewed_at,
+            "passed": review.passed,
+            "move_played_san": review.user_move,
+            "eval_delta_cp": review.eval_delta,
+        })
+        responses.append(
+            _build_review_response(
+                blunder_id=review.blunder_id,
+                pass_streak=pass_streak,
+                reviewed_at=reviewed_at,
+                created_at=blunders[review.blunder_id].created_at,
+            )
+        )
+
+    db.execute(insert(BlunderReview), review_rows)
+    db.execute(
+        update(Blunder),
+        [
+            {"id": blunder_id, "pass_streak": pass_streak, "last_reviewed_at": reviewed_at}
+            for blunder_id, pass_streak in pass_streaks.items()
+        ],
     )
+    db.commit()
+
+    for player_color in _get_blunder_player_colors(db, blunder_ids):
+        _refresh_opening_scores_best_effort(db, user.user_id, player_color)
+
+    return SrsReviewBatchResponse(reviews=responses)
@@ -1,20 +1,36 @@
 from __future__ import annotations
 
+import os
 from datetime import datetime, timedelta, timezone
-import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy import func
+from sqlalchemy import DateTime, Integer, String, and_, case, column, distinct, func, select, table, true
 from sqlalchemy.orm import Session
 
 from app.db import get_db
 from app.models import Blunder, GameSession, Move, Position, RatingHistory, SessionMove
 from app.rating import DEFAULT_RATING
 from app.security import TokenPayload, get_current_user
+from app.stats_summary_cache import get_cached_summary, store_summary
 
 router = APIRouter(prefix="/api/stats", tags=["stats"])
 
+# Materialized view created by migration 20261016_03 (Postgres only) and
+# refreshed by scripts/refresh_stats_summary.py.  Not part of Base.metadata.
+stats_session_summary_mv = table(
+    "stats_session_summary_mv",
+    column("user_id", Integer),
+    column("window_days", Integer),
+    column("player_color", String),
+    column("status", String),
+    column("result", String),
+    column("games", Integer),
+    column("timed_games", Integer),
+    column("duration_seconds"),
+    column("generated_at", DateTime(timezone=True)),
+)
+
 
 class GameRecord(BaseModel):
     wins: int
@@ -169,13 +185,17 @@ def get_rating_history(
 
     rows = query.all()
 
-    # Get latest rating regardless of time filter
-    latest = (
-        db.query(RatingHistory)
-        .filter(RatingHistory.user_id == user.user_id)
-        .order_by(RatingHistory.recorded_at.desc())
-        .first()
-    )
+    # Get latest rating regardless of time filter; an unfiltered ascending
+    # history already ends with it.
+    if range == "all":
+        latest = rows[-1] if rows else None
+    else:
+        latest = (
+            db.query(RatingHistory)
+            .filter(RatingHistory.user_id == user.user_id)
+            .order_by(RatingHistory.recorded_at.desc())
+            .first()
+        )
 
     return RatingHistoryResponse(
         ratings=[
@@ -192,8 +212,14 @@ def get_rating_history(
     )
 
 
+def _use_stats_summary_mv(db: Session) -> bool:
+    if os.environ.get("STATS_SUMMARY_MV", "").lower() != "true":
+        return False
+    return db.get_bind().dialect.name == "postgresql"
+
+
 def _base_color_summary() -> ColorSummary:
-    return ColorSummary(
+    return ColorSummary.model_construct(
         games=0,
         completed=0,
         wins=0,
@@ -217,28 +243,116 @@ def get_stats_summary(
             detail="window_days must be one of: 0, 7, 30, 90, 365",
         )
 
+    cached = get_cached_summary(user.user_id, window_days)
+    if cached is not None:
+        return cached
+
     now = datetime.now(timezone.utc)
     cutoff = None if window_days == 0 else now - timedelta(days=window_days)
+    generated_at = now
 
-    session_query = db.query(GameSession).filter(GameSession.user_id == user.user_id)
+    session_filters = [GameSession.user_id == user.user_id]
     if cutoff is not None:
-        session_query = session_query.filter(GameSession.started_at >= cutoff)
-    sessions = session_query.all()
-    session_ids = [session.id for session in sessions]
-
-    move_count_by_session: dict[uuid.UUID, int] = {}
-    if session_ids:
-        move_count_rows = (
-            db.query(SessionMove.session_id, func.count(SessionMove.id))
-            .filter(SessionMove.session_id.in_(session_ids))
-            .group_by(SessionMove.session_id)
+        session_filters.append(GameSession.started_at >= cutoff)
+
+    # One aggregate row per (color, status, result) instead of one row per session.
+    if _use_stats_summary_mv(db):
+        mv = stats_session_summary_mv.c
+        session_rows = db.execute(
+            select(
+                mv.player_color,
+                mv.status,
+                func.nullif(mv.result, "").label("result"),
+                mv.games,
+                mv.timed_games,
+                mv.duration_seconds,
+                mv.generated_at,
+            ).where(mv.user_id == user.user_id, mv.window_days == window_days)
+        ).all()
+        if session_rows:
+            # Report when the precomputed session aggregates were built.
+            generated_at = min(row.generated_at for row in session_rows)
+        # The move queries below run live; restrict them to the sessions the
+        # snapshot counted so avg_moves and sessions_with_uploaded_moves_pct
+        # never divide live numerators by a stale number of games.
+        session_filters = [
+            GameSession.user_id == user.user_id,
+            GameSession.started_at <= generated_at,
+        ]
+        if cutoff is not None:
+            session_filters.append(
+                GameSession.started_at >= generated_at - timedelta(days=window_days)
+            )
+    else:
+        timed_session = and_(GameSession.status == "ended", GameSession.ended_at.isnot(None))
+        session_rows = (
+            db.query(
+                GameSession.player_color,
+                GameSession.status,
+                GameSession.result,
+                func.count().label("games"),
+                func.count().filter(timed_session).label("timed_games"),
+                func.sum(
+                    func.extract("epoch", GameSession.ended_at) - func.extract("epoch", GameSession.started_at)
+                )
+                .filter(timed_session)
+                .label("duration_seconds"),
+            )
+            .filter(*session_filters)
+            .group_by(GameSession.player_color, GameSession.status, GameSession.result)
             .all()
         )
-        move_count_by_session = {
-            row[0]: int(row[1]) for row in move_count_rows
-        }
 
-    played = len(sessions)
+    # The session-move totals and all library scalars are independent of the
+    # queries above, so fetch them together in a single round trip; the
+    # blunder figures share one pass over the user's blunders.
+    move_stats = (
+        select(
+            func.count(SessionMove.id).label("moves"),
+            func.count(distinct(SessionMove.session_id)).label("sessions"),
+        )
+        .join(GameSession, GameSession.id == SessionMove.session_id)
+        .where(*session_filters)
+        .subquery()
+    )
+    new_blunders_count = func.count()
+    if cutoff is not None:
+        new_blunders_count = new_blunders_count.filter(Blunder.created_at >= cutoff)
+    blunder_stats = (
+        select(
+            func.count().label("blunders_total"),
+            new_blunders_count.label("new_blunders_in_window"),
+            func.avg(Blunder.eval_loss_cp).label("avg_blunder_eval_loss_cp"),
+        )
+        .where(Blunder.user_id == user.user_id)
+        .subquery()
+    )
+    totals_row = (
+        db.query(
+            move_stats.c.moves,
+            move_stats.c.sessions,
+            blunder_stats.c.blunders_total,
+            blunder_stats.c.new_blunders_in_window,
+            blunder_stats.c.avg_blunder_eval_loss_cp,
+            select(func.count(Position.id))
+            .where(Position.user_id == user.user_id)
+            .scalar_subquery()
+            .label("positions_total"),
+            select(func.count())
+            .select_from(Move)
+            .join(Position, Position.id == Move.from_position_id)
+            .where(Position.user_id == user.user_id)
+            .scalar_subquery()
+            .label("edges_total"),
+        )
+        .select_from(move_stats)
+        .join(blunder_stats, true())
+        .one()
+    )
+    total_moves_across_sessions = int(totals_row.moves or 0)
+    sessions_with_uploaded_moves = int(totals_row.sessions or 0)
+
+    played = 0
     completed = 0
     active = 0
     wins = 0
@@ -246,47 +360,45 @@ def get_stats_summary(
     draws = 0
     resigns = 0
     abandons = 0
-    ended_duration_seconds: list[float] = []
-    total_moves_across_sessions = 0
+    timed_games = 0
+    total_duration_seconds = 0.0
 
     per_color_games = {
         "white": {"games": 0, "completed": 0, "wins": 0, "losses": 0, "draws": 0},
         "black": {"games": 0, "completed": 0, "wins": 0, "losses": 0, "draws": 0},
     }
 
-    for session in sessions:
-        player_color = "black" if session.player_color == "black" else "white"
-        per_color_games[player_color]["games"] += 1
-
-        total_moves_across_sessions += move_count_by_session.get(session.id, 0)
-
-        if session.status == "ended":
-            completed += 1
-            per_color_games[player_color]["completed"] += 1
-            if session.ended_at is not None:
-                ended_duration_seconds.append(
-                    (session.ended_at - session.started_at).total_seconds()
-                )
-        elif session.status == "active":
-            active += 1
-
-        if session.result == "checkmate_win":
-            wins += 1
-            per_color_games[player_color]["wins"] += 1
-        elif session.result == "checkmate_loss":
-            losses += 1
-            per_color_games[player_color]["losses"] += 1
-        elif session.result == "draw":
-            draws += 1
-            per_color_games[player_color]["draws"] += 1
-        elif session.result == "resign":
-            resigns += 1
-        elif session.result == "abandon":
-            abandons += 1
+    for row in session_rows:
+        player_color = "black" if row.player_color == "black" else "white"
+        games = int(row.games)
+        played += games
+        per_color_games[player_color]["games"] += games
+
+        if row.status == "ended":
+            completed += games
+            per_color_games[player_color]["completed"] += games
+            timed_games += int(row.timed_games or 0)
+            total_duration_seconds += float(row.duration_seconds or 0)
+        elif row.status == "active":
+            active += games
+
+        if row.result == "checkmate_win":
+            wins += games
+            per_color_games[player_color]["wins"] += games
+        elif row.result == "checkmate_loss":
+            losses += games
+            per_color_games[player_color]["losses"] += games
+        elif row.result == "draw":
+            draws += games
+            per_color_games[player_color]["draws"] += games
+        elif row.result == "resign":
+            resigns += games
+        elif row.result == "abandon":
+            abandons += games
 
     avg_duration_seconds = (
-        int(round(sum(ended_duration_seconds) / len(ended_duration_seconds)))
-        if ended_duration_seconds
+        int(round(total_duration_seconds / timed_games))
+        if timed_games
         else 0
     )
     avg_moves = (
@@ -295,20 +407,31 @@ def get_stats_summary(
         else 0.0
     )
 
-    player_move_rows: list[tuple[str, str | None, int | None]] = []
-    if session_ids:
+    # One aggregate row per (color, classification) instead of one row per move.
+    player_move_rows = []
+    if played:
         player_move_rows = (
-            db.query(GameSession.player_color, SessionMove.classification, SessionMove.eval_delta)
+            db.query(
+                GameSession.player_color,
+                SessionMove.classification,
+                func.count().label("moves"),
+                func.sum(
+                    case((SessionMove.eval_delta > 0, SessionMove.eval_delta), else_=0)
+                ).label("cpl_sum"),
+                func.count(SessionMove.eval_delta).label("cpl_count"),
+            )
             .join(SessionMove, SessionMove.session_id == GameSession.id)
             .filter(
-                GameSession.id.in_(session_ids),
+                *session_filters,
                 SessionMove.color == GameSession.player_color,
             )
+            .group_by(GameSession.player_color, SessionMove.classification)
             .all()
         )
 
-    player_moves = len(player_move_rows)
-    cpl_values: list[int] = []
+    player_moves = 0
+    cpl_sum = 0
+    cpl_count = 0
     mistake_count = 0
     blunder_count = 0
     quality_counts = {
@@ -320,44 +443,49 @@ def get_stats_summary(
         "blunder": 0,
     }
     by_color_move_totals = {"white": 0, "black": 0}
-    by_color_cpl_values: dict[str, list[int]] = {"white": [], "black": []}
+    by_color_cpl_sums = {"white": 0, "black": 0}
+    by_color_cpl_counts = {"white": 0, "black": 0}
     by_color_blunders = {"white": 0, "black": 0}
 
-    for player_color, classification, eval_delta in player_move_rows:
-        color_key = "black" if player_color == "black" else "white"
-        by_color_move_totals[color_key] += 1
-
-        if eval_delta is not None:
-            normalized = max(eval_delta, 0)
-            cpl_values.append(normalized)
-            by_color_cpl_values[color_key].append(normalized)
-
-        if classification == "mistake":
-            mistake_count += 1
-        if classification == "blunder":
-            blunder_count += 1
-            by_color_blunders[color_key] += 1
-        if classification in quality_counts:
-            quality_counts[classification] += 1
+    for row in player_move_rows:
+        color_key = "black" if row.player_color == "black" else "white"
+        moves = int(row.moves)
+        row_cpl_sum = int(row.cpl_sum or 0)
+        row_cpl_count = int(row.cpl_count or 0)
+
+        player_moves += moves
+        cpl_sum += row_cpl_sum
+        cpl_count += row_cpl_count
+        by_color_move_totals[color_key] += moves
+        by_color_cpl_sums[color_key] += row_cpl_sum
+        by_color_cpl_counts[color_key] += row_cpl_count
+
+        if row.classification == "mistake":
+            mistake_count += moves
+        if row.classification == "blunder":
+            blunder_count += moves
+            by_color_blunders[color_key] += moves
+        if row.classification in quality_counts:
+            quality_counts[row.classification] += moves
 
     classified_move_total = sum(quality_counts.values())
-    avg_cpl = _round1(sum(cpl_values) / len(cpl_values)) if cpl_values else 0.0
+    avg_cpl = _round1(cpl_sum / cpl_count) if cpl_count else 0.0
 
     colors = {
         "white": _base_color_summary(),
         "black": _base_color_summary(),
     }
     for color in ("white", "black"):
-        color_cpl_values = by_color_cpl_values[color]
-        colors[color] = ColorSummary(
+        color_cpl_count = by_color_cpl_counts[color]
+        colors[color] = ColorSummary.model_construct(
             games=per_color_games[color]["games"],
             completed=per_color_games[color]["completed"],
             wins=per_color_games[color]["wins"],
             losses=per_color_games[color]["losses"],
             draws=per_color_games[color]["draws"],
             avg_cpl=(
-                _round1(sum(color_cpl_values) / len(color_cpl_values))
-                if color_cpl_values
+                _round1(by_color_cpl_sums[color] / color_cpl_count)
+                if color_cpl_count
                 else 0.0
             ),
             blunders_per_100_moves=_safe_rate(
@@ -365,7 +493,7 @@ def get_stats_summary(
             ),
         )
 
-    quality_distribution = MoveQualityDistribution(
+    quality_distribution = MoveQualityDistribution.model_construct(
         best=_safe_rate(quality_counts["best"], classified_move_total),
         excellent=_safe_rate(quality_counts["excellent"], classified_move_total),
         good=_safe_rate(quality_counts["good"], classified_move_total),
@@ -374,49 +502,31 @@ def get_stats_summary(
         blunder=_safe_rate(quality_counts["blunder"], classified_move_total),
     )
 
-    blunders_total = (
-        db.query(func.count(Blunder.id))
-        .filter(Blunder.user_id == user.user_id)
-        .scalar()
-    ) or 0
-    positions_total = (
-        db.query(func.count(Position.id))
-        .filter(Position.user_id == user.user_id)
-        .scalar()
-    ) or 0
-    edges_total = (
-        db.query(func.count())
-        .select_from(Move)
-        .join(Position, Position.id == Move.from_position_id)
-        .filter(Position.user_id == user.user_id)
-        .scalar()
-    ) or 0
-
-    window_blunders_query = db.query(Blunder).filter(Blunder.user_id == user.user_id)
-    if cutoff is not None:
-        window_blunders_query = window_blunders_query.filter(Blunder.created_at >= cutoff)
-    new_blunders_in_window = window_blunders_query.count()
-
-    avg_blunder_eval_loss_cp_raw = (
-        db.query(func.avg(Blunder.eval_loss_cp))
-        .filter(Blunder.user_id == user.user_id)
-        .scalar()
-    )
+    blunders_total = totals_row.blunders_total or 0
+    positions_total = totals_row.positions_total or 0
+    edges_total = totals_row.edges_total or 0
+    new_blunders_in_window = int(totals_row.new_blunders_in_window or 0)
     avg_blunder_eval_loss_cp = (
-        int(round(float(avg_blunder_eval_loss_cp_raw)))
-        if avg_blunder_eval_loss_cp_raw is not None
+        int(round(float(totals_row.avg_blunder_eval_loss_cp)))
+        if totals_row.avg_blunder_eval_loss_cp is not None
         else 0
     )
 
     top_costly_blunders_rows = (
-        db.query(Blunder)
+        db.query(
+            Blunder.id,
+            Blunder.eval_loss_cp,
+            Blunder.bad_move_san,
+            Blunder.best_move_san,
+            Blunder.created_at,
+        )
         .filter(Blunder.user_id == user.user_id)
         .order_by(Blunder.eval_loss_cp.desc(), Blunder.created_at.desc())
         .limit(5)
         .all()
     )
     top_costly_blunders = [
-        TopCostlyBlunder(
+        TopCostlyBlunder.model_construct(
             blunder_id=row.id,
             eval_loss_cp=row.eval_loss_cp,
             bad_move_san=row.bad_move_san,
@@ -426,21 +536,18 @@ def get_stats_summary(
         for row in top_costly_blunders_rows
     ]
 
-    sessions_with_uploaded_moves = sum(
-        1 for session_id in session_ids if move_count_by_session.get(session_id, 0) > 0
-    )
     sessions_with_uploaded_moves_pct = _safe_rate(
         sessions_with_uploaded_moves, played
     )
 
-    return StatsSummaryResponse(
+    summary = StatsSummaryResponse.model_construct(
         window_days=window_days,
-        generated_at=now,
-        games=GamesSummary(
+        generated_at=generated_at,
+        games=GamesSummary.model_construct(
             played=played,
             completed=completed,
             active=active,
-            record=GameRecord(
+            record=GameRecord.model_construct(
                 wins=wins,
                 losses=losses,
                 draws=draws,
@@ -450,18 +557,18 @@ def get_stats_summary(
             avg_duration_seconds=avg_duration_seconds,
             avg_moves=avg_moves,
         ),
-        colors=ColorSplitSummary(
+        colors=ColorSplitSummary.model_construct(
             white=colors["white"],
             black=colors["black"],
         ),
-        moves=MoveSummary(
+        moves=MoveSummary.model_construct(
             player_moves=player_moves,
             avg_cpl=avg_cpl,
             mistakes_per_100_moves=_safe_rate(mistake_count, player_moves),
             blunders_per_100_moves=_safe_rate(blunder_count, player_moves),
             quality_distribution=quality_distribution,
         ),
-        library=LibrarySummary(
+        library=LibrarySummary.model_construct(
             blunders_total=int(blunders_total),
             positions_total=int(positions_total),
             edges_total=int(edges_total),
@@ -469,7 +576,7 @@ def get_stats_summary(
             avg_blunder_eval_loss_cp=avg_blunder_eval_loss_cp,
             top_costly_blunders=top_costly_blunders,
         ),
-        data_completeness=DataCompletenessSummary(
+        data_completeness=DataCompletenessSummary.model_construct(
             sessions_with_uploaded_moves_pct=sessions_with_uploaded_moves_pct,
             notes=[
                 "Per-move metrics use player moves only.",
@@ -477,3 +584,5 @@ def get_stats_summary(
             ],
         ),
     )
+    store_summary(user.user_id, window_days, summary)
+    return summary
@@ -7,10 +7,16 @@ are recognized as identical by normalizing FEN strings before hashing.
 from __future__ import annotations
 
 import hashlib
+from functools import lru_cache
 
 import chess
 
 
+FEN_CACHE_SIZE = 65536
+FEN_HASH_DIGEST_SIZE = 16
+
+
+@lru_cache(maxsize=FEN_CACHE_SIZE)
 def normalize_fen(fen: str) -> str:
     """Strip move clocks from FEN for position hashing.
 
@@ -19,8 +25,20 @@ def normalize_fen(fen: str) -> str:
 
     The en passant square is canonicalized: only kept when an actual
     en passant capture is legal (using python-chess validation).
+
+    Memoized, since the same positions (opening theory especially) recur
+    across replays, lookups and dedup.
+
+    Raises:
+        ValueError: If the FEN is malformed. Positions without an en passant
+            square skip the board parse, so only their field layout is checked.
     """
-    parts = fen.split(" ")
+    parts = fen.split(" ", 5)
+    if len(parts) < 4 or parts[1] not in ("w", "b"):
+        raise ValueError(f"Invalid FEN: {fen!r}")
+    # Most positions carry no EP square; skip board construction for them
+    if parts[3] == "-":
+        return " ".join(parts[:4])
     board = chess.Board(fen)
     # Only include EP square if a legal en passant capture exists
     if board.has_legal_en_passant():
@@ -30,13 +48,19 @@ def normalize_fen(fen: str) -> str:
     return " ".join(parts[:4])
 
 
-def fen_hash(fen: str) -> str:
-    """Generate SHA256 hash of normalized FEN."""
+@lru_cache(maxsize=FEN_CACHE_SIZE)
+def fen_hash(fen: str) -> bytes:
+    """Generate the raw BLAKE2b-128 digest of normalized FEN.
+
+    The hash is a dedup key, not a commitment, so a 16-byte BLAKE2b digest
+    is enough and cheaper than SHA256 on these short inputs. It is stored
+    as raw bytes (``positions.fen_hash`` is BYTEA).
+    """
     normalized = normalize_fen(fen)
-    return hashlib.sha256(normalized.encode()).hexdigest()
+    return hashlib.blake2b(normalized.encode(), digest_size=FEN_HASH_DIGEST_SIZE).digest()
 
 
 def active_color(fen: str) -> str:
     """Return 'white' or 'black' from the FEN active color field."""
-    parts = fen.split(" ")
+    parts = fen.split(" ", 2)
     return "white" if parts[1] == "w" else "black"
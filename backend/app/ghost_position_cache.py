@@ -0,0 +1,137 @@
+"""Per-session cache of position ids used by ghost-move lookups.
+
+Every next-opponent-move request starts by resolving the current FEN to
+one of the user's stored positions.  At game start the user's positions
+for the opponent's side to move are loaded once into an in-process
+``{fen_hash: position_id}`` map keyed by game session, so lookups of
+stored positions skip that query.
+
+Positions are never deleted, so a hit is always valid.  A miss is not:
+the cache lives in one process, and positions can be created by another
+worker, another game tab or a script.  Misses therefore fall back to the
+database.  Blunder recording adds the positions it creates to this
+process's warm sessions via ``add_user_positions`` so they hit here.
+
+Memory is bounded by the total number of cached positions across sessions,
+not just the number of sessions, and entries expire after ``TTL_SECONDS``
+so sessions that are abandoned without ``/api/game/end`` do not linger.
+Evicted or expired sessions fall back to the database as well.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from sqlalchemy import select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.models import Position
+
+MAX_CACHED_SESSIONS = 256
+MAX_CACHED_POSITIONS = 200_000
+TTL_SECONDS = 6 * 60 * 60.0
+
+_lock = threading.Lock()
+# session_id -> (expires_at, user_id, active_color, {fen_hash: position_id})
+_session_positions: OrderedDict[
+    uuid.UUID, tuple[float, int, str, dict[bytes, int]]
+] = OrderedDict()
+_cached_position_count = 0
+
+
+def warm_session_positions(
+    bind: Engine | Connection,
+    *,
+    session_id: uuid.UUID,
+    user_id: int,
+    active_color: str,
+) -> None:
+    """Load the user's positions with ``active_color`` to move for a session.
+
+    Runs as a background task after the start-game response, so it opens
+    its own DB session on ``bind`` rather than reusing the request's.
+    """
+    global _cached_position_count
+    with Session(bind=bind) as db:
+        rows = db.execute(
+            select(Position.fen_hash, Position.id).where(
+                Position.user_id == user_id,
+                Position.active_color == active_color,
+            )
+        ).all()
+
+    positions = {row.fen_hash: row.id for row in rows}
+    if len(positions) > MAX_CACHED_POSITIONS:
+        # Too large to cache on its own; every lookup uses the database.
+        drop_session_positions(session_id)
+        return
+    with _lock:
+        _pop_session(session_id)
+        _session_positions[session_id] = (
+            time.monotonic() + TTL_SECONDS,
+            user_id,
+            active_color,
+            positions,
+        )
+        _cached_position_count += len(positions)
+        while (
+            len(_session_positions) > MAX_CACHED_SESSIONS
+            or _cached_position_count > MAX_CACHED_POSITIONS
+        ):
+            _, (_, _, _, evicted) = _session_positions.popitem(last=False)
+            _cached_position_count -= len(evicted)
+
+
+def get_cached_position_id(session_id: uuid.UUID, fen_hash: bytes) -> int | None:
+    """Return the cached position id, or None if the session or FEN is not cached."""
+    with _lock:
+        entry = _session_positions.get(session_id)
+        if entry is None:
+            return None
+        expires_at, _, _, positions = entry
+        if expires_at <= time.monotonic():
+            _pop_session(session_id)
+            return None
+        _session_positions.move_to_end(session_id)
+        return positions.get(fen_hash)
+
+
+def add_user_positions(
+    user_id: int, positions: list[tuple[bytes, int, str]]
+) -> None:
+    """Add newly committed ``(fen_hash, position_id, active_color)`` rows.
+
+    Each of the user's warm sessions takes the positions whose side to move
+    matches its own, so lookups of those positions hit without a query.
+    """
+    global _cached_position_count
+    if not positions:
+        return
+    with _lock:
+        for _, cached_user_id, active_color, cached in _session_positions.values():
+            if cached_user_id != user_id:
+                continue
+            for hash_val, position_id, color in positions:
+                if color == active_color and hash_val not in cached:
+                    cached[hash_val] = position_id
+                    _cached_position_count += 1
+        while _cached_position_count > MAX_CACHED_POSITIONS:
+            _, (_, _, _, evicted) = _session_positions.popitem(last=False)
+            _cached_position_count -= len(evicted)
+
+
+def drop_session_positions(session_id: uuid.UUID) -> None:
+    with _lock:
+        _pop_session(session_id)
+
+
+def _pop_session(session_id: uuid.UUID) -> None:
+    """Remove a session's entry; the caller must hold ``_lock``."""
+    global _cached_position_count
+    entry = _session_positions.pop(session_id, None)
+    if entry is not None:
+        _cached_position_count -= len(entry[3])
@@ -5,19 +5,57 @@ Translates a target ELO + UCI move list into a single opponent move
 by calling the maiachess.com Maia3 endpoint.
 """
 import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
 from dataclasses import dataclass
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
 MAIA3_URL = "https://www.maiachess.com/api/v1/play/get_move"
 MAIA3_TIMEOUT_S = 5
 
+# Opening move sequences repeat across users and games, and Maia3's top
+# move is deterministic per (model, move list), so short sequences are
+# served from an in-process LRU instead of the remote API.
+MAIA3_CACHE_MAX_PLIES = 20
+MAIA3_CACHE_MAX_ENTRIES = 50_000
+MAIA3_CACHE_TTL_S = 24 * 60 * 60
+
 ELO_BINS = [
     600, 800, 1000, 1100, 1200, 1300, 1400, 1500,
     1600, 1700, 1800, 1900, 2000, 2200, 2400, 2600,
 ]
+_MAIA_NAMES = [f"maia_kdd_{b}" for b in ELO_BINS]
+
+
+def _build_session() -> requests.Session:
+    """Pooled keep-alive session so each move skips a fresh TCP+TLS handshake."""
+    session = requests.Session()
+    retry = Retry(
+        total=2,
+        # Never retry read timeouts: a hung Maia3 would block the request
+        # for several MAIA3_TIMEOUT_S instead of failing after one.
+        read=0,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503, 504],
+        # get_move is a read-only query, so retrying the POST is safe.
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+    return session
+
+
+_SESSION = _build_session()
+
+_cache_lock = threading.Lock()
+_move_cache: OrderedDict[tuple[str, tuple[str, ...]], tuple[float, "Maia3Move"]] = OrderedDict()
 
 
 class Maia3Error(Exception):
@@ -31,9 +69,43 @@ class Maia3Move:
 
 
 def elo_to_maia_name(elo: int) -> str:
-    """Map a numeric ELO to the nearest maia_kdd_<bin> model name."""
-    nearest = min(ELO_BINS, key=lambda b: abs(b - elo))
-    return f"maia_kdd_{nearest}"
+    """Map a numeric ELO to the nearest maia_kdd_<bin> model name.
+
+    Ties go to the lower bin.
+    """
+    i = bisect_left(ELO_BINS, elo)
+    if i == 0:
+        return _MAIA_NAMES[0]
+    if i == len(ELO_BINS):
+        return _MAIA_NAMES[-1]
+    lower, upper = ELO_BINS[i - 1], ELO_BINS[i]
+    return _MAIA_NAMES[i - 1] if elo - lower <= upper - elo else _MAIA_NAMES[i]
+
+
+def _get_cached_move(key: tuple[str, tuple[str, ...]]) -> Maia3Move | None:
+    with _cache_lock:
+        entry = _move_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, move = entry
+        if expires_at <= time.monotonic():
+            del _move_cache[key]
+            return None
+        _move_cache.move_to_end(key)
+        return move
+
+
+def _store_move(key: tuple[str, tuple[str, ...]], move: Maia3Move) -> None:
+    with _cache_lock:
+        _move_cache[key] = (time.monotonic() + MAIA3_CACHE_TTL_S, move)
+        _move_cache.move_to_end(key)
+        while len(_move_cache) > MAIA3_CACHE_MAX_ENTRIES:
+            _move_cache.popitem(last=False)
+
+
+def clear_move_cache() -> None:
+    with _cache_lock:
+        _move_cache.clear()
 
 
 def get_move(moves: list[str], target_elo: int) -> Maia3Move:
@@ -48,10 +120,18 @@ def get_move(moves: list[str], target_elo: int) -> Maia3Move:
         Maia3Error: On network failure, non-200 response, or bad JSON.
     """
     maia_name = elo_to_maia_name(target_elo)
+    cache_key = None
+    if len(moves) <= MAIA3_CACHE_MAX_PLIES:
+        cache_key = (maia_name, tuple(moves))
+        cached = _get_cached_move(cache_key)
+        if cached is not None:
+            logger.info("Maia3 cache hit: model=%s moves=%d move=%s", maia_name, len(moves), cached.uci)
+            return cached
+
     logger.info("Maia3 request: model=%s elo=%d moves=%d", maia_name, target_elo, len(moves))
 
     try:
-        resp = requests.post(
+        resp = _SESSION.post(
             MAIA3_URL,
             params={
                 "maia_name": maia_name,
@@ -81,6 +161,9 @@ def get_move(moves: list[str], target_elo: int) -> Maia3Move:
             move_delay=data.get("move_delay", 0.0),
         )
         logger.info("Maia3 response: move=%s delay=%.2f (HTTP %d, %.0fms)", move.uci, move.move_delay, resp.status_code, resp.elapsed.total_seconds() * 1000)
-        return move
     except (ValueError, KeyError, TypeError) as exc:
         raise Maia3Error(f"Maia3 response parse error: {exc}") from exc
+
+    if cache_key is not None:
+        _store_move(cache_key, move)
+    return move
@@ -1,13 +1,13 @@
 import logging
+import threading
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
 
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.exceptions import RequestValidationError
 from starlette import status
-from sqlalchemy import text
 
 from app.api.analysis import router as analysis_router
 from app.api.auth import router as auth_router
@@ -19,26 +19,32 @@ from app.api.openings import router as openings_router
 from app.api.stats import router as stats_router
 from app.api.session import router as session_router
 from app.api.srs import router as srs_router
-from app.db import engine
+from app.db import DB_POOL_PREWARM, engine, prewarm_pool
 from app.security import AuthMiddleware
 from app.http_logging import HTTPLoggingMiddleware
 from app.logging_config import configure_logging
+from app.responses import ORJSONResponse
 
 configure_logging()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Database health check
-    with engine.connect() as connection:
-        connection.execute(text("SELECT 1"))
-
+    # No blocking startup ping: the pool uses pool_pre_ping, so connections
+    # are validated lazily on checkout and /health/db reports DB reachability.
+    # Optional prewarming runs off the startup path for the same reason.
+    if DB_POOL_PREWARM > 0:
+        threading.Thread(target=prewarm_pool, name="db-prewarm", daemon=True).start()
     yield
     engine.dispose()
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="Ghost Replay API", version="0.1.0", lifespan=lifespan)
+    app = FastAPI(
+        title="Ghost Replay API",
+        version="0.1.0",
+        lifespan=lifespan,
+    )
 
     app.add_middleware(
         AuthMiddleware,
@@ -51,6 +57,8 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
     app.add_middleware(HTTPLoggingMiddleware)
+    # Outermost, so request logging still sees uncompressed bodies.
+    app.add_middleware(GZipMiddleware, minimum_size=512)
 
     app.include_router(analysis_router)
     app.include_router(auth_router)
@@ -69,7 +77,7 @@ def create_app() -> FastAPI:
         *,
         code: str,
         details: object | None = None,
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         # Keep `detail` for backwards compatibility while adding a standard envelope.
         payload = {
             "detail": message,
@@ -81,10 +89,10 @@ def create_app() -> FastAPI:
         }
         if details is not None:
             payload["error"]["details"] = details
-        return JSONResponse(status_code=status_code, content=payload)
+        return ORJSONResponse(status_code=status_code, content=payload)
 
     @app.exception_handler(HTTPException)
-    async def http_exception_handler(_: Request, exc: HTTPException) -> JSONResponse:
+    async def http_exception_handler(_: Request, exc: HTTPException) -> ORJSONResponse:
         if isinstance(exc.detail, str):
             message = exc.detail
             details = None
@@ -99,7 +107,7 @@ def create_app() -> FastAPI:
         )
 
     @app.exception_handler(RequestValidationError)
-    async def validation_exception_handler(_: Request, exc: RequestValidationError) -> JSONResponse:
+    async def validation_exception_handler(_: Request, exc: RequestValidationError) -> ORJSONResponse:
         return _build_error_response(
             status.HTTP_422_UNPROCESSABLE_CONTENT,
             "Validation error",
@@ -108,7 +116,7 @@ def create_app() -> FastAPI:
         )
 
     @app.exception_handler(Exception)
-    async def unhandled_exception_handler(_: Request, __: Exception) -> JSONResponse:
+    async def unhandled_exception_handler(_: Request, __: Exception) -> ORJSONResponse:
         return _build_error_response(
             status.HTTP_500_INTERNAL_SERVER_ERROR,
             "Internal server error",
@@ -120,6 +128,3 @@ def create_app() -> FastAPI:
         return {"name": "ghostreplay-api", "status": "ok"}
 
     return app
-
-
-app = create_app()
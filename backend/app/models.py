@@ -6,17 +6,19 @@ from sqlalchemy import (
     Boolean,
     CheckConstraint,
     DateTime,
+    Enum,
     Float,
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
 )
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy.sql import func
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.sql import func, text
 
 
 class Base(DeclarativeBase):
@@ -25,6 +27,10 @@ class Base(DeclarativeBase):
 
 BIGINT_SQLITE = BigInteger().with_variant(Integer, "sqlite")
 
+MOVE_CLASSIFICATIONS = ("best", "excellent", "good", "inaccuracy", "mistake", "blunder")
+# Native PG enum on Postgres; falls back to VARCHAR on SQLite.
+MoveClassificationEnum = Enum(*MOVE_CLASSIFICATIONS, name="move_classification")
+
 
 class User(Base):
     __tablename__ = "users"
@@ -48,13 +54,19 @@ class Position(Base):
     __table_args__ = (
         UniqueConstraint("user_id", "fen_hash", name="uq_positions_user_fen_hash"),
         CheckConstraint("active_color in ('white','black')", name="ck_positions_active_color"),
-        Index("idx_positions_user", "user_id"),
         Index("idx_positions_user_active_color", "user_id", "active_color"),
+        # Index-only (user_id, fen_hash) -> id lookups for ghost moves and upserts.
+        Index(
+            "idx_positions_user_fen_covering",
+            "user_id",
+            "fen_hash",
+            postgresql_include=["id"],
+        ),
     )
 
     id: Mapped[int] = mapped_column(BIGINT_SQLITE, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(BIGINT_SQLITE, nullable=False)
-    fen_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    fen_hash: Mapped[bytes] = mapped_column(LargeBinary(16), nullable=False)
     fen_raw: Mapped[str] = mapped_column(Text, nullable=False)
     active_color: Mapped[str] = mapped_column(String(5), nullable=False)
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
@@ -64,9 +76,22 @@ class Blunder(Base):
     __tablename__ = "blunders"
     __table_args__ = (
         UniqueConstraint("user_id", "position_id", name="uq_blunders_user_position"),
-        Index("idx_blunders_user", "user_id"),
-        Index("idx_blunders_position_user", "position_id", "user_id"),
-        Index("idx_blunders_due", "user_id", "pass_streak", "last_reviewed_at"),
+        # Index-only probe for the ghost-candidate join (SRS + scoring columns).
+        Index(
+            "idx_blunders_position_user_covering",
+            "position_id",
+            "user_id",
+            postgresql_include=["id", "eval_loss_cp", "pass_streak", "last_reviewed_at", "created_at"],
+        ),
+        # Top-costly listing: index-only scan bounded by LIMIT.
+        Index(
+            "idx_blunders_user_costly",
+            "user_id",
+            text("eval_loss_cp DESC"),
+            text("created_at DESC"),
+            postgresql_include=["id", "bad_move_san", "best_move_san"],
+        ),
+        Index("idx_blunders_user_created", "user_id", "created_at"),
     )
 
     id: Mapped[int] = mapped_column(BIGINT_SQLITE, primary_key=True, autoincrement=True)
@@ -80,6 +105,10 @@ class Blunder(Base):
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     source_session_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True), ForeignKey("game_sessions.id"), nullable=True)
 
+    # lazy="raise": callers must load it explicitly (contains_eager/selectinload)
+    # instead of issuing one SELECT per blunder.
+    position: Mapped[Position] = relationship(lazy="raise")
+
 
 class BlunderReview(Base):
     __tablename__ = "blunder_reviews"
@@ -103,6 +132,14 @@ class GameSession(Base):
         Index("idx_game_sessions_user", "user_id"),
         Index("idx_game_sessions_status", "status"),
         Index("idx_game_sessions_user_started", "user_id", "started_at"),
+        # Covering index for the history listing (user + ended, newest first).
+        Index(
+            "idx_game_sessions_history",
+            "user_id",
+            "status",
+            text("ended_at DESC"),
+            postgresql_include=["id", "started_at", "result", "engine_elo", "player_color"],
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -163,7 +200,7 @@ class SessionMove(Base):
             name="ck_session_moves_decision_source",
         ),
         UniqueConstraint("session_id", "move_number", "color", name="uq_session_moves_session_move_color"),
-        Index("idx_session_moves_session", "session_id"),
+        Index("idx_session_moves_session_classification", "session_id", "classification"),
     )
 
     id: Mapped[int] = mapped_column(BIGINT_SQLITE, primary_key=True, autoincrement=True)
@@ -181,7 +218,7 @@ class SessionMove(Base):
     best_move_san: Mapped[str | None] = mapped_column(String(10))
     best_move_eval_cp: Mapped[int | None] = mapped_column(Integer)
     eval_delta: Mapped[int | None] = mapped_column(Integer)
-    classification: Mapped[str | None] = mapped_column(String(20))
+    classification: Mapped[str | None] = mapped_column(MoveClassificationEnum)
     fen_before: Mapped[str | None] = mapped_column(Text)
     best_move_uci: Mapped[str | None] = mapped_column(String(5))
     decision_source: Mapped[str | None] = mapped_column(String(20))
@@ -13,6 +13,7 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import os
 import pickle
 from pathlib import Path
 from types import MappingProxyType
@@ -253,7 +254,10 @@ def _load_or_build(
     # Cache before freezing (MappingProxyType is not picklable)
     try:
         cache_dir.mkdir(parents=True, exist_ok=True)
-        cache_file.write_bytes(
+        # Write then rename so concurrent processes (uvicorn or pytest-xdist
+        # workers) never load a half-written pickle.
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_bytes(
             pickle.dumps(
                 {
                     "cache_version": CACHE_VERSION,
@@ -263,6 +267,7 @@ def _load_or_build(
                 }
             )
         )
+        os.replace(tmp_file, cache_file)
         logger.info("opening_graph: cached to %s", cache_file)
     except Exception:
         logger.warning("opening_graph: failed to write cache", exc_info=True)
@@ -41,7 +41,7 @@ def choose_move(fen: str, target_elo: int, moves: list[str] | None = None) -> Co
     board = chess.Board(fen)
     uci_move = chess.Move.from_uci(result.uci)
 
-    if uci_move not in board.legal_moves:
+    if not board.is_legal(uci_move):
         raise ValueError(
             f"Maia3 returned illegal move {result.uci} for FEN {fen}"
         )
@@ -0,0 +1,23 @@
+"""Response classes shared by API routers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson.
+
+    Used for error envelopes and for handlers that return an instance
+    directly.  Those handlers bypass ``response_model`` validation, so do
+    that only with trusted, DB-sourced payloads.  Never set it as a route's
+    ``response_class`` or the app default: that turns off pydantic's native
+    JSON serialization for ``response_model`` routes.
+    UUIDs and datetimes are serialized natively.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
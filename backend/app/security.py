@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import math
 import os
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
@@ -14,6 +18,11 @@ from starlette.responses import JSONResponse
 
 JWT_ALGORITHM = "HS256"
 DEFAULT_TOKEN_TTL = timedelta(days=7)
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "12"))
+# Verified tokens are remembered briefly so a client polling with the same
+# Bearer token is not re-verified on every request.
+TOKEN_CACHE_TTL_SECONDS = 60.0
+TOKEN_CACHE_MAX_ENTRIES = 10_000
 
 
 @dataclass(frozen=True)
@@ -27,13 +36,16 @@ def hash_password(password: str) -> str:
     if not password:
         raise ValueError("Password must be non-empty.")
     password_bytes = password.encode("utf-8")
-    password_hash = bcrypt.hashpw(password_bytes, bcrypt.gensalt())
+    password_hash = bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
     return password_hash.decode("utf-8")
 
 
 def verify_password(password: str, password_hash: str) -> bool:
     if not password or not password_hash:
         return False
+    # Not a bcrypt hash ($2a$/$2b$/$2y$); checkpw could only reject it.
+    if not password_hash.startswith("$2"):
+        return False
     try:
         return bcrypt.checkpw(
             password.encode("utf-8"),
@@ -66,7 +78,38 @@ def create_access_token(
     return jwt.encode(payload, get_jwt_secret(), algorithm=JWT_ALGORITHM)
 
 
+_token_cache_lock = threading.Lock()
+# token -> (cache expiry, token exp claim, payload)
+_token_cache: OrderedDict[str, tuple[float, float, TokenPayload]] = OrderedDict()
+
+
+def clear_token_cache() -> None:
+    with _token_cache_lock:
+        _token_cache.clear()
+
+
 def decode_access_token(token: str) -> TokenPayload:
+    now = time.time()
+    with _token_cache_lock:
+        entry = _token_cache.get(token)
+        if entry is not None:
+            cached_until, expires_at, cached = entry
+            if now < cached_until and now < expires_at:
+                _token_cache.move_to_end(token)
+                return cached
+            # Let jwt.decode below raise the appropriate error for expiry.
+            del _token_cache[token]
+
+    token_payload, expires_at = _verify_access_token(token)
+    with _token_cache_lock:
+        _token_cache[token] = (now + TOKEN_CACHE_TTL_SECONDS, expires_at, token_payload)
+        while len(_token_cache) > TOKEN_CACHE_MAX_ENTRIES:
+            _token_cache.popitem(last=False)
+    return token_payload
+
+
+def _verify_access_token(token: str) -> tuple[TokenPayload, float]:
+    """Verify the signature and claims; return the payload and its exp timestamp."""
     payload = jwt.decode(token, get_jwt_secret(), algorithms=[JWT_ALGORITHM])
     sub = payload.get("sub")
     username = payload.get("username")
@@ -83,7 +126,8 @@ def decode_access_token(token: str) -> TokenPayload:
     if not isinstance(is_anonymous, bool):
         raise InvalidTokenError("Invalid anonymous flag.")
 
-    return TokenPayload(user_id=user_id, username=username, is_anonymous=is_anonymous)
+    token_payload = TokenPayload(user_id=user_id, username=username, is_anonymous=is_anonymous)
+    return token_payload, float(payload.get("exp", math.inf))
 
 
 def get_current_user(request: Request) -> TokenPayload:
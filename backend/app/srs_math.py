@@ -1,12 +1,20 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Iterable
 from datetime import datetime, timezone
 
 BASE_INTERVAL_HOURS = 4.0
 BACKOFF_FACTOR = 2.0
 MAX_INTERVAL_HOURS = 4320.0
 
+# Interval per pass streak; the cap is reached by streak 11, so any streak
+# past the end of the table reads the capped last entry.
+_INTERVAL_TABLE: tuple[float, ...] = tuple(
+    min(BASE_INTERVAL_HOURS * (BACKOFF_FACTOR**k), MAX_INTERVAL_HOURS)
+    for k in range(64)
+)
+
 
 def _coerce_datetime(timestamp: datetime | str) -> datetime:
     if isinstance(timestamp, datetime):
@@ -24,28 +32,52 @@ def as_utc(timestamp: datetime | str) -> datetime:
 
 
 def expected_interval_hours(pass_streak: int) -> float:
-    interval = BASE_INTERVAL_HOURS * (BACKOFF_FACTOR ** max(pass_streak, 0))
-    return min(interval, MAX_INTERVAL_HOURS)
+    return _INTERVAL_TABLE[min(max(pass_streak, 0), len(_INTERVAL_TABLE) - 1)]
 
 
-def calculate_priority(
-    *,
+def _priority(
+    now_utc: datetime,
     pass_streak: int,
     last_reviewed_at: datetime | None,
     created_at: datetime | None,
-    now: datetime,
 ) -> float:
     reference_time = last_reviewed_at or created_at
     if not reference_time:
         return 0.0
-
     hours_since_review = max(
-        (as_utc(now) - as_utc(reference_time)).total_seconds() / 3600.0,
+        (now_utc - as_utc(reference_time)).total_seconds() / 3600.0,
         0.0,
     )
     return hours_since_review / expected_interval_hours(pass_streak)
 
 
+def calculate_priority(
+    *,
+    pass_streak: int,
+    last_reviewed_at: datetime | None,
+    created_at: datetime | None,
+    now: datetime,
+) -> float:
+    return _priority(as_utc(now), pass_streak, last_reviewed_at, created_at)
+
+
+def calculate_priorities(
+    rows: Iterable[tuple[int, datetime | None, datetime | None]],
+    *,
+    now: datetime,
+) -> list[float]:
+    """Priority for each ``(pass_streak, last_reviewed_at, created_at)`` row.
+
+    Same values as calling ``calculate_priority`` per row, with ``now``
+    normalized once for the whole batch.
+    """
+    now_utc = as_utc(now)
+    return [
+        _priority(now_utc, pass_streak, last_reviewed_at, created_at)
+        for pass_streak, last_reviewed_at, created_at in rows
+    ]
+
+
 def calculate_urgency(
     *,
     pass_streak: int,
@@ -0,0 +1,60 @@
+"""Short-lived in-process cache of ``/api/stats/summary`` responses.
+
+The summary is typically polled by the stats dashboard while nothing about
+the user's games changes.  Responses are kept for ``TTL_SECONDS`` per
+``(user_id, window_days)``, and the endpoints that write sessions, session
+moves or blunders drop the user's entries so a poll right after a game
+sees fresh numbers.  Writes made outside the API (scripts) are picked up
+once the TTL expires.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+TTL_SECONDS = 60.0
+MAX_CACHED_USERS = 2048
+
+_lock = threading.Lock()
+# user_id -> {window_days: (expires_at, summary)}
+_summaries: OrderedDict[int, dict[int, tuple[float, Any]]] = OrderedDict()
+
+
+def get_cached_summary(user_id: int, window_days: int) -> Any | None:
+    """Return the cached summary, or None if absent or expired."""
+    with _lock:
+        windows = _summaries.get(user_id)
+        if windows is None:
+            return None
+        entry = windows.get(window_days)
+        if entry is None:
+            return None
+        expires_at, summary = entry
+        if expires_at <= time.monotonic():
+            del windows[window_days]
+            return None
+        _summaries.move_to_end(user_id)
+        return summary
+
+
+def store_summary(user_id: int, window_days: int, summary: Any) -> None:
+    with _lock:
+        windows = _summaries.setdefault(user_id, {})
+        windows[window_days] = (time.monotonic() + TTL_SECONDS, summary)
+        _summaries.move_to_end(user_id)
+        while len(_summaries) > MAX_CACHED_USERS:
+            _summaries.popitem(last=False)
+
+
+def invalidate_user_summaries(user_id: int) -> None:
+    """Drop every cached window for a user after their stats inputs change."""
+    with _lock:
+        _summaries.pop(user_id, None)
+
+
+def clear_summaries() -> None:
+    with _lock:
+        _summaries.clear()
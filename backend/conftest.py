@@ -1,224 +1,227 @@
 import os
 import uuid
+from datetime import datetime, timezone
+from functools import lru_cache
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 os.environ.setdefault("JWT_SECRET", "test-secret-32-bytes-minimum-length")
+# Minimum bcrypt cost; the tests only need hashes to round-trip.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+# The session client runs the app lifespan; never prewarm the real pool.
+os.environ["DB_POOL_PREWARM"] = "0"
 
 from app.db import get_db
-from app.main import app
+from app.main import create_app
 from app.models import GameSession, User
 from app.security import create_access_token, hash_password
+from app.stats_summary_cache import clear_summaries
 
+# Private to this process, so every pytest-xdist worker gets its own database.
 SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///:memory:"
 engine = create_engine(
     SQLALCHEMY_TEST_DATABASE_URL,
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-
-def _create_test_schema(conn) -> None:
-    conn.execute(text("PRAGMA foreign_keys=ON"))
-    conn.execute(text("""
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username VARCHAR(50) UNIQUE,
-            password_hash VARCHAR(255),
-            is_anonymous BOOLEAN NOT NULL DEFAULT 1,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL
-        )
-    """))
-    conn.execute(text("""
-        CREATE TABLE IF NOT EXISTS game_sessions (
-            id TEXT PRIMARY KEY,
-            user_id INTEGER NOT NULL,
-            started_at TIMESTAMP NOT NULL,
-            ended_at TIMESTAMP,
-            status VARCHAR(20) NOT NULL,
-            result VARCHAR(20),
-            engine_elo INTEGER NOT NULL,
-            blunder_recorded BOOLEAN NOT NULL DEFAULT 0,
-            is_rated BOOLEAN NOT NULL DEFAULT 1,
-            player_color VARCHAR(5) NOT NULL DEFAULT 'white',
-            pgn TEXT
-        )
-    """))
-    conn.execute(text("""
-        CREATE TABLE IF NOT EXISTS positions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            fen_hash VARCHAR(64) NOT NULL,
-            fen_raw TEXT NOT NULL,
-            active_color VARCHAR(5) NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(user_id, fen_hash)
-        )
-    """))
-    conn.execute(text("""
-        CREATE TABLE IF NOT EXISTS blunders (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            position_id INTEGER NOT NULL,
-            bad_move_san VARCHAR(10) NOT NULL,
-            best_move_san VARCHAR(10) NOT NULL,
-            eval_loss_cp INTEGER NOT NULL,
-            pass_streak INTEGER NOT NULL DEFAULT 0,
-            last_reviewed_at TIMESTAMP,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            source_session_id TEXT,
-            UNIQUE(user_id, position_id),
-            FOREIGN KEY (position_id) REFERENCES positions(id),
-            FOREIGN KEY (source_session_id) REFERENCES game_sessions(id)
-        )
-    """))
-    conn.execute(text("""
-        CREATE TABLE IF NOT EXISTS moves (
-            from_position_id INTEGER NOT NULL,
-            move_san VARCHAR(10) NOT NULL,
-            to_position_id INTEGER NOT NULL,
-            PRIMARY KEY (from_position_id, move_san),
-            FOREIGN KEY (from_position_id) REFERENCES positions(id),
-            FOREIGN KEY (to_position_id) REFERENCES positions(id)
-        )
-    """))
-    conn.execute(text("""
-        CREATE TABLE IF NOT EXISTS session_moves (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            session_id TEXT NOT NULL,
-            move_number INTEGER NOT NULL,
-            color VARCHAR(5) NOT NULL,
-            move_san VARCHAR(10) NOT NULL,
-            fen_after TEXT NOT NULL,
-            eval_cp INTEGER,
-            eval_mate INTEGER,
-            best_move_san VARCHAR(10),
-            best_move_eval_cp INTEGER,
-            eval_delta INTEGER,
-            classification VARCHAR(20),
-            fen_before TEXT,
-            best_move_uci VARCHAR(5),
-            decision_source VARCHAR(20),
-            target_blunder_id INTEGER,
-            UNIQUE(session_id, move_number, color),
-            FOREIGN KEY (session_id) REFERENCES game_sessions(id) ON DELETE CASCADE,
-            FOREIGN KEY (target_blunder_id) REFERENCES blunders(id),
-            CHECK (decision_source IS NULL OR decision_source IN ('ghost_path', 'backend_engine', 'local_fallback'))
-        )
-    """))
-    conn.execute(text("""
-        CREATE TABLE IF NOT EXISTS rating_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            game_session_id TEXT NOT NULL,
-            rating INTEGER NOT NULL,
-            is_provisional BOOLEAN NOT NULL,
-            games_played INTEGER NOT NULL,
-            recorded_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
-        )
-    """))
-    conn.execute(text("""
-        CREATE TABLE IF NOT EXISTS analysis_cache (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            fen_before TEXT NOT NULL,
-            move_uci VARCHAR(5) NOT NULL,
-            move_san VARCHAR(10) NOT NULL,
-            best_move_uci VARCHAR(5),
-            best_move_san VARCHAR(10),
-            played_eval INTEGER,
-            best_eval INTEGER,
-            eval_delta INTEGER,
-            classification VARCHAR(20),
-            source VARCHAR(20) NOT NULL DEFAULT 'game',
-            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(fen_before, move_uci)
-        )
-    """))
-    conn.execute(text("""
-        CREATE TABLE IF NOT EXISTS opening_score_batches (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            player_color VARCHAR(5) NOT NULL,
-            generation INTEGER NOT NULL,
-            registry_fingerprint TEXT,
-            computed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(user_id, player_color, generation)
-        )
-    """))
-    conn.execute(text("""
-        CREATE TABLE IF NOT EXISTS opening_score_cursors (
-            user_id INTEGER NOT NULL,
-            player_color VARCHAR(5) NOT NULL,
-            latest_generation INTEGER NOT NULL DEFAULT 0,
-            PRIMARY KEY (user_id, player_color)
-        )
-    """))
-    conn.execute(text("""
-        CREATE TABLE IF NOT EXISTS user_opening_scores (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            batch_id INTEGER NOT NULL,
-            user_id INTEGER NOT NULL,
-            player_color VARCHAR(5) NOT NULL,
-            opening_key TEXT NOT NULL,
-            opening_name TEXT NOT NULL,
-            opening_family TEXT NOT NULL,
-            opening_score FLOAT NOT NULL,
-            confidence FLOAT NOT NULL,
-            coverage FLOAT NOT NULL,
-            weighted_depth FLOAT NOT NULL,
-            sample_size INTEGER NOT NULL,
-            last_practiced_at TIMESTAMP,
-            strongest_branch_name TEXT,
-            strongest_branch_key TEXT,
-            strongest_branch_score FLOAT,
-            weakest_branch_name TEXT,
-            weakest_branch_key TEXT,
-            weakest_branch_score FLOAT,
-            underexposed_branch_name TEXT,
-            underexposed_branch_key TEXT,
-            underexposed_branch_value FLOAT,
-            computed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(batch_id, opening_key),
-            FOREIGN KEY (batch_id) REFERENCES opening_score_batches(id) ON DELETE CASCADE
-        )
-    """))
-    conn.execute(text("""
-        CREATE TABLE IF NOT EXISTS blunder_reviews (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            blunder_id INTEGER NOT NULL,
-            session_id TEXT NOT NULL,
-            reviewed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
-            passed BOOLEAN NOT NULL,
-            move_played_san VARCHAR(10) NOT NULL,
-            eval_delta_cp INTEGER NOT NULL,
-            FOREIGN KEY (blunder_id) REFERENCES blunders(id) ON DELETE CASCADE,
-            FOREIGN KEY (session_id) REFERENCES game_sessions(id)
-        )
-    """))
-    conn.commit()
-
-
-def _reset_test_schema(conn) -> None:
-    conn.execute(text("DROP TABLE IF EXISTS blunder_reviews"))
-    conn.execute(text("DROP TABLE IF EXISTS user_opening_scores"))
-    conn.execute(text("DROP TABLE IF EXISTS opening_score_cursors"))
-    conn.execute(text("DROP TABLE IF EXISTS opening_score_batches"))
-    conn.execute(text("DROP TABLE IF EXISTS analysis_cache"))
-    conn.execute(text("DROP TABLE IF EXISTS rating_history"))
-    conn.execute(text("DROP TABLE IF EXISTS session_moves"))
-    conn.execute(text("DROP TABLE IF EXISTS moves"))
-    conn.execute(text("DROP TABLE IF EXISTS blunders"))
-    conn.execute(text("DROP TABLE IF EXISTS positions"))
-    conn.execute(text("DROP TABLE IF EXISTS game_sessions"))
-    conn.execute(text("DROP TABLE IF EXISTS users"))
-    conn.commit()
-    _create_test_schema(conn)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False)
+
+
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, _connection_record) -> None:
+    # pysqlite's implicit BEGIN handling breaks SAVEPOINT, so SQLAlchemy
+    # emits BEGIN itself (see the SQLAlchemy pysqlite savepoint notes).
+    dbapi_connection.isolation_level = None
+    # Must be set outside a transaction, where SQLite would ignore it.
+    dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+
+@event.listens_for(engine, "begin")
+def _emit_sqlite_begin(conn) -> None:
+    conn.exec_driver_sql("BEGIN")
+
+
+app = create_app()
+
+
+TEST_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username VARCHAR(50) UNIQUE,
+    password_hash VARCHAR(255),
+    is_anonymous BOOLEAN NOT NULL DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS game_sessions (
+    id TEXT PRIMARY KEY,
+    user_id INTEGER NOT NULL,
+    started_at TIMESTAMP NOT NULL,
+    ended_at TIMESTAMP,
+    status VARCHAR(20) NOT NULL,
+    result VARCHAR(20),
+    engine_elo INTEGER NOT NULL,
+    blunder_recorded BOOLEAN NOT NULL DEFAULT 0,
+    is_rated BOOLEAN NOT NULL DEFAULT 1,
+    player_color VARCHAR(5) NOT NULL DEFAULT 'white',
+    pgn TEXT
+);
+
+CREATE TABLE IF NOT EXISTS positions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    fen_hash BLOB NOT NULL,
+    fen_raw TEXT NOT NULL,
+    active_color VARCHAR(5) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(user_id, fen_hash)
+);
+
+CREATE TABLE IF NOT EXISTS blunders (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    position_id INTEGER NOT NULL,
+    bad_move_san VARCHAR(10) NOT NULL,
+    best_move_san VARCHAR(10) NOT NULL,
+    eval_loss_cp INTEGER NOT NULL,
+    pass_streak INTEGER NOT NULL DEFAULT 0,
+    last_reviewed_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    source_session_id TEXT,
+    UNIQUE(user_id, position_id),
+    FOREIGN KEY (position_id) REFERENCES positions(id),
+    FOREIGN KEY (source_session_id) REFERENCES game_sessions(id)
+);
+
+CREATE TABLE IF NOT EXISTS moves (
+    from_position_id INTEGER NOT NULL,
+    move_san VARCHAR(10) NOT NULL,
+    to_position_id INTEGER NOT NULL,
+    PRIMARY KEY (from_position_id, move_san),
+    FOREIGN KEY (from_position_id) REFERENCES positions(id),
+    FOREIGN KEY (to_position_id) REFERENCES positions(id)
+);
+
+CREATE TABLE IF NOT EXISTS session_moves (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL,
+    move_number INTEGER NOT NULL,
+    color VARCHAR(5) NOT NULL,
+    move_san VARCHAR(10) NOT NULL,
+    fen_after TEXT NOT NULL,
+    eval_cp INTEGER,
+    eval_mate INTEGER,
+    best_move_san VARCHAR(10),
+    best_move_eval_cp INTEGER,
+    eval_delta INTEGER,
+    classification VARCHAR(20),
+    fen_before TEXT,
+    best_move_uci VARCHAR(5),
+    decision_source VARCHAR(20),
+    target_blunder_id INTEGER,
+    UNIQUE(session_id, move_number, color),
+    FOREIGN KEY (session_id) REFERENCES game_sessions(id) ON DELETE CASCADE,
+    FOREIGN KEY (target_blunder_id) REFERENCES blunders(id),
+    CHECK (decision_source IS NULL OR decision_source IN ('ghost_path', 'backend_engine', 'local_fallback'))
+);
+
+CREATE TABLE IF NOT EXISTS rating_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    game_session_id TEXT NOT NULL,
+    rating INTEGER NOT NULL,
+    is_provisional BOOLEAN NOT NULL,
+    games_played INTEGER NOT NULL,
+    recorded_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS analysis_cache (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    fen_before TEXT NOT NULL,
+    move_uci VARCHAR(5) NOT NULL,
+    move_san VARCHAR(10) NOT NULL,
+    best_move_uci VARCHAR(5),
+    best_move_san VARCHAR(10),
+    played_eval INTEGER,
+    best_eval INTEGER,
+    eval_delta INTEGER,
+    classification VARCHAR(20),
+    source VARCHAR(20) NOT NULL DEFAULT 'game',
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(fen_before, move_uci)
+);
+
+CREATE TABLE IF NOT EXISTS opening_score_batches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    player_color VARCHAR(5) NOT NULL,
+    generation INTEGER NOT NULL,
+    registry_fingerprint TEXT,
+    computed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(user_id, player_color, generation)
+);
+
+CREATE TABLE IF NOT EXISTS opening_score_cursors (
+    user_id INTEGER NOT NULL,
+    player_color VARCHAR(5) NOT NULL,
+    latest_generation INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, player_color)
+);
+
+CREATE TABLE IF NOT EXISTS user_opening_scores (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    batch_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    player_color VARCHAR(5) NOT NULL,
+    opening_key TEXT NOT NULL,
+    opening_name TEXT NOT NULL,
+    opening_family TEXT NOT NULL,
+    opening_score FLOAT NOT NULL,
+    confidence FLOAT NOT NULL,
+    coverage FLOAT NOT NULL,
+    weighted_depth FLOAT NOT NULL,
+    sample_size INTEGER NOT NULL,
+    last_practiced_at TIMESTAMP,
+    strongest_branch_name TEXT,
+    strongest_branch_key TEXT,
+    strongest_branch_score FLOAT,
+    weakest_branch_name TEXT,
+    weakest_branch_key TEXT,
+    weakest_branch_score FLOAT,
+    underexposed_branch_name TEXT,
+    underexposed_branch_key TEXT,
+    underexposed_branch_value FLOAT,
+    computed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(batch_id, opening_key),
+    FOREIGN KEY (batch_id) REFERENCES opening_score_batches(id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS blunder_reviews (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    blunder_id INTEGER NOT NULL,
+    session_id TEXT NOT NULL,
+    reviewed_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    passed BOOLEAN NOT NULL,
+    move_played_san VARCHAR(10) NOT NULL,
+    eval_delta_cp INTEGER NOT NULL,
+    FOREIGN KEY (blunder_id) REFERENCES blunders(id) ON DELETE CASCADE,
+    FOREIGN KEY (session_id) REFERENCES game_sessions(id)
+);
+"""
+
+
+def _create_test_schema() -> None:
+    # One executescript call parses and runs the whole schema in SQLite.
+    raw = engine.raw_connection()
+    try:
+        raw.driver_connection.executescript(TEST_SCHEMA_SQL)
+    finally:
+        raw.close()
 
 
 def _override_get_db():
@@ -229,22 +232,40 @@ def _override_get_db():
         db.close()
 
 
-@pytest.fixture(autouse=True)
-def _db_override():
+@pytest.fixture(scope="session", autouse=True)
+def _schema():
+    _create_test_schema()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _get_db_override():
     app.dependency_overrides[get_db] = _override_get_db
-    with engine.connect() as conn:
-        _reset_test_schema(conn)
     yield
     app.dependency_overrides.clear()
 
 
-@pytest.fixture
-def client(_db_override):
-    client = TestClient(app)
-    try:
+@pytest.fixture(autouse=True)
+def _db_override(_schema):
+    # Each test runs inside one outer transaction that is rolled back on
+    # teardown. Sessions join it through SAVEPOINTs, so their commits only
+    # release a savepoint and the schema never has to be rebuilt.
+    connection = engine.connect()
+    transaction = connection.begin()
+    TestingSessionLocal.configure(bind=connection, join_transaction_mode="create_savepoint")
+    clear_summaries()
+    yield
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="session")
+def client():
+    # Shared across tests: the app holds no per-client state, and the
+    # per-test DB isolation comes from _db_override's rollback.  Entering the
+    # client keeps one event-loop portal open for the whole session instead
+    # of starting a fresh portal thread for every request.
+    with TestClient(app) as client:
         yield client
-    finally:
-        client.close()
 
 
 @pytest.fixture
@@ -256,11 +277,16 @@ def db_session(_db_override):
         session.close()
 
 
+@lru_cache(maxsize=256)
+def _bearer_token(user_id: int, username: str, is_anonymous: bool) -> str:
+    # Tokens are valid for days, so one per identity serves the whole run.
+    return create_access_token(user_id=user_id, username=username, is_anonymous=is_anonymous)
+
+
 @pytest.fixture
 def auth_headers():
     def _auth_headers(user_id: int = 123, username: str = "ghost_test", is_anonymous: bool = True) -> dict:
-        token = create_access_token(user_id=user_id, username=username, is_anonymous=is_anonymous)
-        return {"Authorization": f"Bearer {token}"}
+        return {"Authorization": f"Bearer {_bearer_token(user_id, username, is_anonymous)}"}
 
     return _auth_headers
 
@@ -274,34 +300,37 @@ def create_user(db_session):
             is_anonymous=is_anonymous,
         )
         db_session.add(user)
+        # The id is assigned by the flush and, as in the app's sessions,
+        # commit does not expire it, so no reload is needed.
         db_session.commit()
-        db_session.refresh(user)
         return user
 
     return _create_user
 
 
 @pytest.fixture
-def create_game_session(client, auth_headers, db_session):
+def create_game_session(db_session):
+    """Insert an active game session directly and return its id.
+
+    Mirrors the row POST /api/game/start creates; tests of that endpoint
+    call it through the client instead.
+    """
     def _create_game_session(
         user_id: int = 123,
         player_color: str = "white",
         blunder_recorded: bool = False,
     ) -> str:
-        response = client.post(
-            "/api/game/start",
-            json={"engine_elo": 1500, "player_color": player_color},
-            headers=auth_headers(user_id=user_id),
+        session = GameSession(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            started_at=datetime.now(timezone.utc),
+            status="active",
+            engine_elo=1500,
+            blunder_recorded=blunder_recorded,
+            player_color=player_color,
         )
-        assert response.status_code == 201
-        session_id = response.json()["session_id"]
-
-        if blunder_recorded:
-            session = db_session.query(GameSession).filter(GameSession.id == uuid.UUID(session_id)).first()
-            if session:
-                session.blunder_recorded = True
-                db_session.commit()
-
-        return session_id
+        db_session.add(session)
+        db_session.commit()
+        return str(session.id)
 
     return _create_game_session
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Refresh the stats summary materialized view.
+
+Intended to run from cron every few minutes when the API is started with
+STATS_SUMMARY_MV=true.
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, text
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.db import DATABASE_URL
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(message)s",
+    datefmt="%H:%M:%S",
+)
+log = logging.getLogger("refresh_stats_summary")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Refresh the stats summary materialized view.")
+    parser.add_argument(
+        "--database-url",
+        default=DATABASE_URL,
+        help=f"SQLAlchemy database URL (default: {DATABASE_URL})",
+    )
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url, pool_pre_ping=True)
+    start = time.perf_counter()
+    # CONCURRENTLY cannot run inside a transaction block.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY stats_session_summary_mv"))
+    log.info("Refreshed stats_session_summary_mv in %.0fms", (time.perf_counter() - start) * 1000)
+
+
+if __name__ == "__main__":
+    main()
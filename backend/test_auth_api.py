@@ -3,6 +3,8 @@ Tests for POST /api/auth/register endpoint.
 
 Run with: pytest test_auth_api.py -v
 """
+import pytest
+
 from app.models import User
 from app.security import decode_access_token
 
@@ -82,52 +84,19 @@ def test_register_duplicate_username(client):
     assert "already exists" in response.json()["detail"]
 
 
-def test_register_username_too_short(client):
-    """Test that username under 3 chars is rejected."""
-    response = client.post(
-        "/api/auth/register",
-        json={"username": "ab", "password": "password123"}
-    )
-
-    assert response.status_code == 422
-
-
-def test_register_username_too_long(client):
-    """Test that username over 50 chars is rejected."""
-    response = client.post(
-        "/api/auth/register",
-        json={"username": "a" * 51, "password": "password123"}
-    )
-
-    assert response.status_code == 422
-
-
-def test_register_password_too_short(client):
-    """Test that password under 8 chars is rejected."""
-    response = client.post(
-        "/api/auth/register",
-        json={"username": "validuser", "password": "short"}
-    )
-
-    assert response.status_code == 422
-
-
-def test_register_missing_username(client):
-    """Test that missing username is rejected."""
-    response = client.post(
-        "/api/auth/register",
-        json={"password": "password123"}
-    )
-
-    assert response.status_code == 422
-
-
-def test_register_missing_password(client):
-    """Test that missing password is rejected."""
-    response = client.post(
-        "/api/auth/register",
-        json={"username": "validuser"}
-    )
+@pytest.mark.parametrize(
+    "payload",
+    [
+        pytest.param({"username": "ab", "password": "password123"}, id="username-too-short"),
+        pytest.param({"username": "a" * 51, "password": "password123"}, id="username-too-long"),
+        pytest.param({"username": "validuser", "password": "short"}, id="password-too-short"),
+        pytest.param({"password": "password123"}, id="missing-username"),
+        pytest.param({"username": "validuser"}, id="missing-password"),
+    ],
+)
+def test_register_validation_errors(client, payload):
+    """Test that invalid registration payloads are rejected."""
+    response = client.post("/api/auth/register", json=payload)
 
     assert response.status_code == 422
 
@@ -325,28 +294,18 @@ def test_claim_invalid_token(client):
     assert response.status_code == 401
 
 
-def test_claim_username_too_short(client):
-    """Test that new_username under 3 chars is rejected."""
-    reg = _register_anonymous(client)
-
-    response = client.post(
-        "/api/auth/claim",
-        json={"new_username": "ab", "new_password": "newpass123"},
-        headers={"Authorization": f"Bearer {reg['token']}"},
-    )
-
-    assert response.status_code == 422
-
-
-def test_claim_password_too_short(client):
-    """Test that new_password under 8 chars is rejected."""
-    reg = _register_anonymous(client)
-
-    response = client.post(
-        "/api/auth/claim",
-        json={"new_username": "validname", "new_password": "short"},
-        headers={"Authorization": f"Bearer {reg['token']}"},
-    )
+@pytest.mark.parametrize(
+    "payload",
+    [
+        pytest.param({"new_username": "ab", "new_password": "newpass123"}, id="username-too-short"),
+        pytest.param({"new_username": "validname", "new_password": "short"}, id="password-too-short"),
+    ],
+)
+def test_claim_validation_errors(client, auth_headers, payload):
+    """Test that invalid claim payloads are rejected."""
+    # Body validation fails before the account is looked up, so a signed
+    # token is enough; no registration needed.
+    response = client.post("/api/auth/claim", json=payload, headers=auth_headers())
 
     assert response.status_code == 422
 
@@ -368,3 +327,4 @@ def test_claim_can_login_with_new_credentials(client):
 
     assert login_resp.status_code == 200
     assert login_resp.json()["user_id"] == reg["user_id"]
+
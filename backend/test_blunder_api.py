@@ -5,12 +5,24 @@ Run with: pytest test_blunder_api.py -v
 """
 import uuid
 
+import pytest
 from sqlalchemy import text
 
 from app.fen import fen_hash
 from app.models import GameSession
 
 
+# 1. e4 e5 2. Qh5, recorded from the position before white's queen move.
+QH5_BLUNDER = {
+    "pgn": "1. e4 e5 2. Qh5",
+    "fen": "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2",
+    "user_move": "Qh5",
+    "best_move": "Nf3",
+    "eval_before": 50,
+    "eval_after": -100,
+}
+
+
 def test_record_blunder_success(client, auth_headers, create_game_session):
     """Test successful blunder recording with simple PGN."""
     session_id = create_game_session(user_id=123, player_color="white")
@@ -141,26 +153,39 @@ def test_record_blunder_session_not_found(client, auth_headers):
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_record_blunder_wrong_user(client, auth_headers, create_game_session):
-    """Test 403 when session belongs to different user."""
-    session_id = create_game_session(user_id=999, player_color="white")
+@pytest.mark.parametrize(
+    ("owner_id", "override", "authenticated", "status_code", "detail"),
+    [
+        pytest.param(999, {}, True, 403, "not authorized", id="wrong-user"),
+        pytest.param(123, {"pgn": "not valid pgn at all!!!"}, True, 422, None, id="invalid-pgn"),
+        # Starting position, not the position after 1. e4 e5.
+        pytest.param(
+            123,
+            {"fen": "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"},
+            True,
+            422,
+            "mismatch",
+            id="fen-mismatch",
+        ),
+        pytest.param(123, {"fen": "not a fen"}, True, 422, "invalid fen", id="malformed-fen"),
+        pytest.param(123, {}, False, 401, None, id="missing-auth"),
+    ],
+)
+def test_record_blunder_rejected(
+    client, auth_headers, create_game_session, owner_id, override, authenticated, status_code, detail
+):
+    """Test that bad owners, payloads and missing auth are rejected."""
+    session_id = create_game_session(user_id=owner_id, player_color="white")
 
     response = client.post(
         "/api/blunder",
-        json={
-            "session_id": session_id,
-            "pgn": "1. e4 e5 2. Qh5",
-            "fen": "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2",
-            "user_move": "Qh5",
-            "best_move": "Nf3",
-            "eval_before": 50,
-            "eval_after": -100,
-        },
-        headers=auth_headers(user_id=123)
+        json={**QH5_BLUNDER, "session_id": session_id, **override},
+        headers=auth_headers(user_id=123) if authenticated else None,
     )
 
-    assert response.status_code == 403
-    assert "not authorized" in response.json()["detail"].lower()
+    assert response.status_code == status_code
+    if detail is not None:
+        assert detail in response.json()["detail"].lower()
 
 
 def test_record_blunder_already_recorded(client, auth_headers, create_game_session):
@@ -188,50 +213,6 @@ def test_record_blunder_already_recorded(client, auth_headers, create_game_sessi
     assert data["positions_created"] == 0
 
 
-def test_record_blunder_invalid_pgn(client, auth_headers, create_game_session):
-    """Test 422 when PGN is malformed."""
-    session_id = create_game_session(user_id=123, player_color="white")
-
-    response = client.post(
-        "/api/blunder",
-        json={
-            "session_id": session_id,
-            "pgn": "not valid pgn at all!!!",
-            "fen": "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2",
-            "user_move": "Qh5",
-            "best_move": "Nf3",
-            "eval_before": 50,
-            "eval_after": -100,
-        },
-        headers=auth_headers(user_id=123)
-    )
-
-    assert response.status_code == 422
-
-
-def test_record_blunder_fen_mismatch(client, auth_headers, create_game_session):
-    """Test 422 when pre-move FEN doesn't match PGN."""
-    session_id = create_game_session(user_id=123, player_color="white")
-
-    response = client.post(
-        "/api/blunder",
-        json={
-            "session_id": session_id,
-            "pgn": "1. e4 e5 2. Qh5",
-            # Wrong FEN - this is starting position, not after 1. e4 e5
-            "fen": "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
-            "user_move": "Qh5",
-            "best_move": "Nf3",
-            "eval_before": 50,
-            "eval_after": -100,
-        },
-        headers=auth_headers(user_id=123)
-    )
-
-    assert response.status_code == 422
-    assert "mismatch" in response.json()["detail"].lower()
-
-
 def test_record_blunder_rejects_after_first_10_full_moves(
     client, auth_headers, create_game_session
 ):
@@ -372,32 +353,12 @@ def test_record_blunder_duplicate_position(client, auth_headers, create_game_ses
     assert data2["position_id"] == data1["position_id"]
 
 
-def test_record_blunder_missing_auth(client, create_game_session):
-    """Test 401 when no auth token provided."""
-    session_id = create_game_session(user_id=123, player_color="white")
-
-    response = client.post(
-        "/api/blunder",
-        json={
-            "session_id": session_id,
-            "pgn": "1. e4 e5 2. Qh5",
-            "fen": "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2",
-            "user_move": "Qh5",
-            "best_move": "Nf3",
-            "eval_before": 50,
-            "eval_after": -100,
-        },
-    )
-
-    assert response.status_code == 401
-
-
 def test_record_blunder_sets_blunder_recorded_flag(client, auth_headers, create_game_session, db_session):
     """Test that blunder_recorded flag is set on session."""
     session_id = create_game_session(user_id=123, player_color="white")
 
     # Verify flag is false initially
-    session = db_session.query(GameSession).filter(GameSession.id == uuid.UUID(session_id)).first()
+    session = db_session.get(GameSession, uuid.UUID(session_id))
     assert session is not None
     assert session.blunder_recorded is False
 
@@ -420,7 +381,7 @@ def test_record_blunder_sets_blunder_recorded_flag(client, auth_headers, create_
 
     # Verify flag is now true
     db_session.expire_all()
-    session = db_session.query(GameSession).filter(GameSession.id == uuid.UUID(session_id)).first()
+    session = db_session.get(GameSession, uuid.UUID(session_id))
     assert session is not None
     assert session.blunder_recorded is True
 
@@ -559,7 +520,7 @@ def test_record_manual_blunder_wrong_color(client, auth_headers, create_game_ses
 def test_record_manual_blunder_does_not_set_session_flag(client, auth_headers, create_game_session, db_session):
     """Manual capture must not toggle first-auto-blunder session flag."""
     session_id = create_game_session(user_id=123, player_color="white")
-    session = db_session.query(GameSession).filter(GameSession.id == uuid.UUID(session_id)).first()
+    session = db_session.get(GameSession, uuid.UUID(session_id))
     assert session is not None
     assert session.blunder_recorded is False
 
@@ -579,7 +540,7 @@ def test_record_manual_blunder_does_not_set_session_flag(client, auth_headers, c
     assert response.status_code == 201
 
     db_session.expire_all()
-    session = db_session.query(GameSession).filter(GameSession.id == uuid.UUID(session_id)).first()
+    session = db_session.get(GameSession, uuid.UUID(session_id))
     assert session is not None
     assert session.blunder_recorded is False
 
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 
+from sqlalchemy import event
+
 from app.models import Blunder, Position
 
 
@@ -19,7 +21,7 @@ def _create_blunder(
 ) -> Blunder:
     position = Position(
         user_id=user_id,
-        fen_hash=f"hash-{user_id}-{fen_hash_suffix or id(object())}",
+        fen_hash=f"hash-{user_id}-{fen_hash_suffix or id(object())}".encode(),
         fen_raw=fen,
         active_color="white",
     )
@@ -144,6 +146,30 @@ def test_list_blunders_sorted_by_priority_descending(client, auth_headers, db_se
     assert priorities[0] > priorities[1]
 
 
+def test_list_blunders_query_count_is_independent_of_row_count(client, auth_headers, db_session):
+    for suffix in ("a", "b", "c", "d", "e"):
+        _create_blunder(db_session, user_id=123, fen_hash_suffix=suffix)
+    db_session.expire_all()
+
+    selects: list[str] = []
+
+    def _capture_selects(_conn, _cursor, statement, _parameters, _context, _executemany):
+        if statement.lstrip().lower().startswith("select"):
+            selects.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture_selects)
+    try:
+        response = client.get("/api/blunder", headers=auth_headers(user_id=123))
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture_selects)
+
+    assert response.status_code == 200
+    assert len(response.json()) == 5
+    # Blunders joined with positions, plus the latest-review lookup.
+    assert len(selects) == 2
+
+
 def test_list_blunders_requires_auth(client):
     response = client.get("/api/blunder")
     assert response.status_code == 401
@@ -0,0 +1,30 @@
+"""
+Tests for connection-pool helpers in app.db.
+
+Run with: pytest test_db.py -v
+"""
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from app import db
+
+
+def test_prewarm_pool_returns_connections_to_pool(monkeypatch, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'prewarm.db'}", poolclass=QueuePool, pool_size=3)
+    monkeypatch.setattr(db, "engine", engine)
+
+    db.prewarm_pool(3)
+
+    assert engine.pool.checkedout() == 0
+    assert engine.pool.checkedin() == 3
+    engine.dispose()
+
+
+def test_prewarm_pool_survives_unreachable_database(monkeypatch, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'missing' / 'prewarm.db'}", poolclass=QueuePool)
+    monkeypatch.setattr(db, "engine", engine)
+
+    db.prewarm_pool(2)
+
+    assert engine.pool.checkedout() == 0
+    engine.dispose()
@@ -49,16 +49,51 @@ class TestNormalizeFen:
         result = normalize_fen(fen)
         assert "Kq" in result
 
+    def test_no_ep_square_skips_board_parse(self, monkeypatch):
+        """FENs without an EP square are normalized without python-chess."""
+        import app.fen as fen_module
+
+        def fail(*args, **kwargs):
+            raise AssertionError("chess.Board should not be constructed")
+
+        monkeypatch.setattr(fen_module.chess, "Board", fail)
+        fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR b KQkq - 7 42"
+        assert fen_module.normalize_fen.__wrapped__(fen) == (
+            "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR b KQkq -"
+        )
+
+    @pytest.mark.parametrize(
+        "fen",
+        [
+            "garbage",
+            "8/8/8/8/8/8/8/8 w",
+            "8/8/8/8/8/8/8/8 w -",
+            "8/8/8/8/8/8/8/8 x - - 0 1",
+        ],
+    )
+    def test_malformed_fen_raises_value_error(self, fen):
+        """Malformed FENs raise ValueError, including on the no-EP fast path."""
+        with pytest.raises(ValueError):
+            normalize_fen(fen)
+
+    def test_repeated_calls_hit_cache(self):
+        """Repeated FENs are served from the memo cache."""
+        fen = "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3"
+        normalize_fen(fen)
+        hits_before = normalize_fen.cache_info().hits
+        assert normalize_fen(fen) == "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq -"
+        assert normalize_fen.cache_info().hits == hits_before + 1
+
 
 class TestFenHash:
     """Tests for fen_hash function."""
 
-    def test_returns_64_char_hex_string(self):
-        """fen_hash should return a 64-character hex string (SHA256)."""
+    def test_returns_16_byte_digest(self):
+        """fen_hash should return a raw 16-byte digest (BLAKE2b-128)."""
         fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
         result = fen_hash(fen)
-        assert len(result) == 64
-        assert all(c in "0123456789abcdef" for c in result)
+        assert isinstance(result, bytes)
+        assert len(result) == 16
 
     def test_same_position_same_hash(self):
         """Same position should produce the same hash."""
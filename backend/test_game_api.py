@@ -52,7 +52,7 @@ def test_start_game_defaults_player_color_white(client, auth_headers, db_session
     assert data["player_color"] == "white"
 
     # Verify database persistence
-    session = db_session.query(GameSession).filter(GameSession.id == session_uuid).first()
+    session = db_session.get(GameSession, session_uuid)
     assert session is not None
     assert session.player_color == "white"
 
@@ -73,7 +73,7 @@ def test_start_game_with_player_color_black(client, auth_headers, db_session):
     assert data["player_color"] == "black"
 
     # Verify database persistence
-    session = db_session.query(GameSession).filter(GameSession.id == session_uuid).first()
+    session = db_session.get(GameSession, session_uuid)
     assert session is not None
     assert session.player_color == "black"
 
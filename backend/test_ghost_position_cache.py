@@ -0,0 +1,180 @@
+"""Tests for the per-session ghost-move position cache."""
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app import ghost_position_cache
+from app.api.game import find_ghost_move
+from app.fen import fen_hash
+from app.ghost_position_cache import (
+    add_user_positions,
+    drop_session_positions,
+    get_cached_position_id,
+    warm_session_positions,
+)
+from app.models import Blunder, Move, Position
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"
+AFTER_E5_FEN = "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2"
+
+
+def _add_position(db_session, user_id: int, fen: str, color: str) -> Position:
+    position = Position(user_id=user_id, fen_hash=fen_hash(fen), fen_raw=fen, active_color=color)
+    db_session.add(position)
+    db_session.flush()
+    return position
+
+
+def test_warm_loads_only_matching_user_and_color(db_session):
+    black = _add_position(db_session, 123, START_FEN, "black")
+    white = _add_position(db_session, 123, AFTER_E5_FEN, "white")
+    _add_position(db_session, 456, AFTER_E5_FEN.replace(" 2", " 3"), "black")
+    db_session.commit()
+
+    session_id = uuid.uuid4()
+    warm_session_positions(db_session.get_bind(), session_id=session_id, user_id=123, active_color="black")
+
+    assert get_cached_position_id(session_id, black.fen_hash) == black.id
+    assert get_cached_position_id(session_id, white.fen_hash) is None
+    assert get_cached_position_id(uuid.uuid4(), black.fen_hash) is None
+
+    drop_session_positions(session_id)
+    assert get_cached_position_id(session_id, black.fen_hash) is None
+
+
+def test_find_ghost_move_uses_cached_position_id(db_session):
+    start = _add_position(db_session, 123, START_FEN, "black")
+    target = _add_position(db_session, 123, AFTER_E5_FEN, "white")
+    db_session.add(Move(from_position_id=start.id, move_san="e5", to_position_id=target.id))
+    db_session.add(Blunder(
+        user_id=123,
+        position_id=target.id,
+        bad_move_san="Qh5",
+        best_move_san="Nf3",
+        eval_loss_cp=200,
+        created_at=datetime.now(timezone.utc) - timedelta(hours=5),
+    ))
+    db_session.commit()
+
+    session_id = uuid.uuid4()
+    warm_session_positions(db_session.get_bind(), session_id=session_id, user_id=123, active_color="black")
+
+    # Break the DB lookup so only the cache can resolve the start position.
+    start.fen_hash = b"stale"
+    db_session.commit()
+
+    move_san, _, _, _ = find_ghost_move(
+        db=db_session, user_id=123, fen=START_FEN, player_color="white", session_id=session_id,
+    )
+    assert move_san == "e5"
+
+    drop_session_positions(session_id)
+    move_san, _, _, _ = find_ghost_move(
+        db=db_session, user_id=123, fen=START_FEN, player_color="white", session_id=session_id,
+    )
+    assert move_san is None
+
+
+def test_warm_session_miss_falls_back_to_database(db_session):
+    session_id = uuid.uuid4()
+    warm_session_positions(db_session.get_bind(), session_id=session_id, user_id=123, active_color="black")
+
+    # Created after the warm, e.g. by a blunder recorded on another worker.
+    start = _add_position(db_session, 123, START_FEN, "black")
+    target = _add_position(db_session, 123, AFTER_E5_FEN, "white")
+    db_session.add(Move(from_position_id=start.id, move_san="e5", to_position_id=target.id))
+    db_session.add(Blunder(
+        user_id=123,
+        position_id=target.id,
+        bad_move_san="Qh5",
+        best_move_san="Nf3",
+        eval_loss_cp=200,
+        created_at=datetime.now(timezone.utc) - timedelta(hours=5),
+    ))
+    db_session.commit()
+
+    assert get_cached_position_id(session_id, start.fen_hash) is None
+    move_san, _, _, _ = find_ghost_move(
+        db=db_session, user_id=123, fen=START_FEN, player_color="white", session_id=session_id,
+    )
+    assert move_san == "e5"
+    drop_session_positions(session_id)
+
+
+def test_added_positions_reach_warm_sessions(db_session):
+    session_id = uuid.uuid4()
+    warm_session_positions(db_session.get_bind(), session_id=session_id, user_id=123, active_color="black")
+
+    add_user_positions(123, [(b"black-pos", 7, "black"), (b"white-pos", 8, "white")])
+    add_user_positions(456, [(b"other-user", 9, "black")])
+
+    assert get_cached_position_id(session_id, b"black-pos") == 7
+    assert get_cached_position_id(session_id, b"white-pos") is None
+    assert get_cached_position_id(session_id, b"other-user") is None
+    drop_session_positions(session_id)
+
+
+def test_start_game_warms_and_end_game_drops_cache(client, auth_headers, db_session):
+    position = _add_position(db_session, 123, START_FEN, "black")
+    db_session.commit()
+
+    response = client.post(
+        "/api/game/start",
+        json={"engine_elo": 1500, "player_color": "white"},
+        headers=auth_headers(user_id=123),
+    )
+    session_id = uuid.UUID(response.json()["session_id"])
+    assert get_cached_position_id(session_id, position.fen_hash) == position.id
+
+    client.post(
+        "/api/game/end",
+        json={"session_id": str(session_id), "result": "resign", "pgn": "1. e4"},
+        headers=auth_headers(user_id=123),
+    )
+    assert get_cached_position_id(session_id, position.fen_hash) is None
+
+
+def test_sessions_evicted_past_position_budget(db_session, monkeypatch):
+    position = _add_position(db_session, 123, START_FEN, "black")
+    target = _add_position(db_session, 123, AFTER_E5_FEN, "white")
+    db_session.add(Move(from_position_id=position.id, move_san="e5", to_position_id=target.id))
+    db_session.add(Blunder(
+        user_id=123,
+        position_id=target.id,
+        bad_move_san="Qh5",
+        best_move_san="Nf3",
+        eval_loss_cp=200,
+        created_at=datetime.now(timezone.utc) - timedelta(hours=5),
+    ))
+    _add_position(db_session, 456, START_FEN, "black")
+    db_session.commit()
+    monkeypatch.setattr(ghost_position_cache, "MAX_CACHED_POSITIONS", 1)
+
+    first, second = uuid.uuid4(), uuid.uuid4()
+    bind = db_session.get_bind()
+    warm_session_positions(bind, session_id=first, user_id=123, active_color="black")
+    warm_session_positions(bind, session_id=second, user_id=456, active_color="black")
+
+    # Only one position fits, so the older session is evicted and falls back to the DB.
+    assert get_cached_position_id(first, position.fen_hash) is None
+    assert get_cached_position_id(second, position.fen_hash) is not None
+    move_san, _, _, _ = find_ghost_move(
+        db=db_session, user_id=123, fen=START_FEN, player_color="white", session_id=first,
+    )
+    assert move_san == "e5"
+    drop_session_positions(second)
+
+
+def test_abandoned_session_expires(db_session, monkeypatch):
+    position = _add_position(db_session, 123, START_FEN, "black")
+    db_session.commit()
+    clock = SimpleNamespace(monotonic=lambda: 1000.0)
+    monkeypatch.setattr(ghost_position_cache, "time", clock)
+
+    session_id = uuid.uuid4()
+    warm_session_positions(db_session.get_bind(), session_id=session_id, user_id=123, active_color="black")
+    assert get_cached_position_id(session_id, position.fen_hash) == position.id
+
+    clock.monotonic = lambda: 1000.0 + ghost_position_cache.TTL_SECONDS
+    assert get_cached_position_id(session_id, position.fen_hash) is None
+    assert session_id not in ghost_position_cache._session_positions
@@ -128,3 +128,16 @@ def test_history_limit_validation(client, auth_headers):
 
     response = client.get("/api/history?limit=101", headers=auth_headers(user_id=123))
     assert response.status_code == 422
+
+
+def test_history_serializes_db_values_without_validation(client, auth_headers, create_game_session):
+    session_id = create_game_session(user_id=123, player_color="black")
+    _end_game(client, auth_headers, session_id, result="draw")
+
+    response = client.get("/api/history", headers=auth_headers(user_id=123))
+    game = response.json()["games"][0]
+    assert game["session_id"] == session_id
+    assert game["result"] == "draw"
+    assert game["engine_elo"] == 1500
+    assert game["player_color"] == "black"
+    assert datetime.fromisoformat(game["started_at"]) <= datetime.fromisoformat(game["ended_at"])
@@ -6,8 +6,10 @@ import requests
 
 from app.maia3_client import (
     ELO_BINS,
+    MAIA3_CACHE_MAX_PLIES,
     Maia3Error,
     Maia3Move,
+    clear_move_cache,
     elo_to_maia_name,
     get_move,
 )
@@ -46,6 +48,13 @@ def test_all_bins_roundtrip():
 # --- get_move ---
 
 
+@pytest.fixture(autouse=True)
+def _clear_maia3_cache():
+    clear_move_cache()
+    yield
+    clear_move_cache()
+
+
 def _mock_response(json_data: dict, status_code: int = 200) -> MagicMock:
     from datetime import timedelta
 
@@ -57,7 +66,7 @@ def _mock_response(json_data: dict, status_code: int = 200) -> MagicMock:
     return resp
 
 
-@patch("app.maia3_client.requests.post")
+@patch("app.maia3_client._SESSION.post")
 def test_get_move_success(mock_post: MagicMock):
     mock_post.return_value = _mock_response(
         {"top_move": "e7e5", "move_delay": 0.42}
@@ -73,7 +82,7 @@ def test_get_move_success(mock_post: MagicMock):
     assert call_kwargs.kwargs["json"] == ["e2e4"]
 
 
-@patch("app.maia3_client.requests.post")
+@patch("app.maia3_client._SESSION.post")
 def test_get_move_empty_moves(mock_post: MagicMock):
     """Starting position (no moves yet) should work."""
     mock_post.return_value = _mock_response(
@@ -84,21 +93,29 @@ def test_get_move_empty_moves(mock_post: MagicMock):
     assert mock_post.call_args.kwargs["json"] == []
 
 
-@patch("app.maia3_client.requests.post")
+@patch("app.maia3_client._SESSION.post")
 def test_get_move_network_error(mock_post: MagicMock):
     mock_post.side_effect = requests.ConnectionError("connection refused")
     with pytest.raises(Maia3Error, match="request failed"):
         get_move(["e2e4"], 1200)
 
 
-@patch("app.maia3_client.requests.post")
+@patch("app.maia3_client._SESSION.post")
 def test_get_move_timeout(mock_post: MagicMock):
     mock_post.side_effect = requests.Timeout("read timed out")
     with pytest.raises(Maia3Error, match="request failed"):
         get_move(["e2e4"], 1200)
 
 
-@patch("app.maia3_client.requests.post")
+def test_session_retries_gateway_errors_but_not_read_timeouts():
+    from app.maia3_client import _SESSION
+
+    retry = _SESSION.get_adapter("https://").max_retries
+    assert retry.read == 0
+    assert retry.is_retry("POST", 503)
+
+
+@patch("app.maia3_client._SESSION.post")
 def test_get_move_non_200(mock_post: MagicMock):
     resp = _mock_response({}, status_code=500)
     resp.text = "Internal Server Error"
@@ -107,7 +124,7 @@ def test_get_move_non_200(mock_post: MagicMock):
         get_move(["e2e4"], 1200)
 
 
-@patch("app.maia3_client.requests.post")
+@patch("app.maia3_client._SESSION.post")
 def test_get_move_bad_json(mock_post: MagicMock):
     resp = MagicMock(spec=requests.Response)
     resp.status_code = 200
@@ -117,14 +134,14 @@ def test_get_move_bad_json(mock_post: MagicMock):
         get_move(["e2e4"], 1200)
 
 
-@patch("app.maia3_client.requests.post")
+@patch("app.maia3_client._SESSION.post")
 def test_get_move_missing_top_move(mock_post: MagicMock):
     mock_post.return_value = _mock_response({"move_delay": 0.0})
     with pytest.raises(Maia3Error, match="parse error"):
         get_move(["e2e4"], 1200)
 
 
-@patch("app.maia3_client.requests.post")
+@patch("app.maia3_client._SESSION.post")
 def test_get_move_delay_defaults(mock_post: MagicMock):
     """move_delay is optional in the response."""
     mock_post.return_value = _mock_response({"top_move": "d7d5"})
@@ -132,6 +149,40 @@ def test_get_move_delay_defaults(mock_post: MagicMock):
     assert result.move_delay == 0.0
 
 
+@patch("app.maia3_client._SESSION.post")
+def test_get_move_cached_per_model_and_moves(mock_post: MagicMock):
+    mock_post.return_value = _mock_response({"top_move": "e7e5", "move_delay": 0.3})
+
+    assert get_move(["e2e4"], 1200).uci == "e7e5"
+    assert get_move(["e2e4"], 1190).uci == "e7e5"  # same maia_kdd_1200 bin
+    assert mock_post.call_count == 1
+
+    get_move(["e2e4"], 1500)
+    get_move(["d2d4"], 1200)
+    assert mock_post.call_count == 3
+
+
+@patch("app.maia3_client._SESSION.post")
+def test_get_move_long_sequences_not_cached(mock_post: MagicMock):
+    mock_post.return_value = _mock_response({"top_move": "g1f3"})
+    moves = ["e2e4", "e7e5"] * (MAIA3_CACHE_MAX_PLIES // 2 + 1)
+
+    get_move(moves, 1200)
+    get_move(moves, 1200)
+    assert mock_post.call_count == 2
+
+
+@patch("app.maia3_client._SESSION.post")
+def test_get_move_errors_not_cached(mock_post: MagicMock):
+    mock_post.side_effect = requests.ConnectionError("connection refused")
+    with pytest.raises(Maia3Error):
+        get_move(["e2e4"], 1200)
+
+    mock_post.side_effect = None
+    mock_post.return_value = _mock_response({"top_move": "c7c5"})
+    assert get_move(["e2e4"], 1200).uci == "c7c5"
+
+
 # --- choose_move() controller ---
 
 # Position after 1.e4 (black to move)
@@ -415,7 +415,7 @@ def test_backfill_candidate_discovery_finds_historical_pairs(db_session):
 
     ghost_position = Position(
         user_id=234,
-        fen_hash="ghost-white",
+        fen_hash=b"ghost-white",
         fen_raw=START_FULL,
         active_color="white",
     )
@@ -433,7 +433,7 @@ def test_backfill_candidate_discovery_finds_historical_pairs(db_session):
 
     session_position = Position(
         user_id=123,
-        fen_hash="session-black",
+        fen_hash=b"session-black",
         fen_raw=KNIGHT_OPENING_FULL,
         active_color="black",
     )
@@ -474,7 +474,7 @@ def test_backfill_candidate_discovery_applies_optional_filters(db_session):
 
     ghost_position = Position(
         user_id=234,
-        fen_hash="ghost-white-filter",
+        fen_hash=b"ghost-white-filter",
         fen_raw=START_FULL,
         active_color="white",
     )
@@ -572,7 +572,7 @@ def test_srs_review_refreshes_relevant_opening_snapshot(
     session_id = create_game_session(user_id=123, player_color="black")
     position = Position(
         user_id=123,
-        fen_hash="review-black",
+        fen_hash=b"review-black",
         fen_raw=KNIGHT_OPENING_FULL,
         active_color="black",
     )
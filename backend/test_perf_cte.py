@@ -23,7 +23,7 @@ def _seed_position_graph(db, user_id, num_positions=10_000, branching=3):
         # Synthetic FEN-like string; we hash it directly to avoid
         # python-chess board validation overhead during seeding.
         fen_raw = f"pos_{i} {'w' if color == 'white' else 'b'} - - 0 {i}"
-        h = hashlib.sha256(fen_raw.encode()).hexdigest()
+        h = hashlib.blake2b(fen_raw.encode(), digest_size=16).digest()
         pos = Position(
             user_id=user_id,
             fen_hash=h,
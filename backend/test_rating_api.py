@@ -190,6 +190,8 @@ def test_rating_history_range_all(client, auth_headers, create_game_session, db_
     response = client.get("/api/stats/rating-history?range=all", headers=auth_headers(user_id=123))
     data = response.json()
     assert len(data["ratings"]) == 2
+    assert data["current_rating"] == 1250
+    assert data["games_played"] == 2
 
 
 def test_rating_history_invalid_range(client, auth_headers):
@@ -1,11 +1,29 @@
 """
-Unit tests for password hashing utilities.
+Unit tests for password hashing and token utilities.
 
 Run with: pytest test_security.py -v
 """
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+
+import jwt
 import pytest
 
-from app.security import hash_password, verify_password
+from app import security
+from app.security import (
+    create_access_token,
+    decode_access_token,
+    hash_password,
+    verify_password,
+)
+
+
+@pytest.fixture(autouse=True)
+def _empty_token_cache():
+    security.clear_token_cache()
+    yield
+    security.clear_token_cache()
 
 
 def test_hash_password_returns_hash():
@@ -45,3 +63,44 @@ def test_verify_password_failure():
 def test_verify_password_handles_empty():
     assert verify_password("", "not-empty") is False
     assert verify_password("not-empty", "") is False
+
+
+def test_verify_password_rejects_non_bcrypt_hash():
+    assert verify_password("hunter2", "plaintext-hunter2") is False
+
+
+def test_hash_password_uses_configured_rounds():
+    from app.security import BCRYPT_ROUNDS
+
+    assert hash_password("hunter2").startswith(f"$2b${BCRYPT_ROUNDS:02d}$")
+
+
+def test_decode_access_token_caches_verified_tokens(monkeypatch):
+    token = create_access_token(user_id=7, username="cached", is_anonymous=False)
+    first = decode_access_token(token)
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("token should have been served from the cache")
+
+    monkeypatch.setattr(security.jwt, "decode", fail_decode)
+    assert decode_access_token(token) == first
+
+
+def test_decode_access_token_cache_honours_expiry(monkeypatch):
+    token = create_access_token(
+        user_id=7, username="expiring", is_anonymous=False,
+        expires_delta=timedelta(seconds=30),
+    )
+    decode_access_token(token)
+
+    later = time.time() + 45
+
+    def expired_decode(*args, **kwargs):
+        raise jwt.ExpiredSignatureError("Signature has expired")
+
+    # Past the token's exp the cached entry must not be served, even though
+    # the cache TTL has not elapsed; the token is re-verified instead.
+    monkeypatch.setattr(security, "time", SimpleNamespace(time=lambda: later))
+    monkeypatch.setattr(security.jwt, "decode", expired_decode)
+    with pytest.raises(jwt.ExpiredSignatureError):
+        decode_access_token(token)
@@ -24,7 +24,7 @@ def _create_blunder(
 ) -> Blunder:
     position = Position(
         user_id=user_id,
-        fen_hash=f"fen-hash-{user_id}-{pass_streak}",
+        fen_hash=f"fen-hash-{user_id}-{pass_streak}".encode(),
         fen_raw="8/8/8/8/8/8/8/8 w - - 0 1",
         active_color="white",
     )
@@ -212,3 +212,80 @@ def test_srs_review_blunder_not_found(client, auth_headers, create_game_session)
 
     assert response.status_code == 404
     assert "blunder" in response.json()["detail"].lower()
+
+
+def _review(session_id: str, blunder_id: int, passed: bool) -> dict:
+    return {
+        "session_id": session_id,
+        "blunder_id": blunder_id,
+        "passed": passed,
+        "user_move": "Nf3" if passed else "Qh5",
+        "eval_delta": 10 if passed else 150,
+    }
+
+
+def test_srs_review_batch_applies_reviews_in_order(client, auth_headers, create_game_session, db_session):
+    session_id = create_game_session(user_id=123, player_color="white")
+    first = _create_blunder(db_session, user_id=123, pass_streak=1)
+    second = _create_blunder(db_session, user_id=123, pass_streak=3)
+
+    response = client.post(
+        "/api/srs/review-batch",
+        json={
+            "reviews": [
+                _review(session_id, first.id, True),
+                _review(session_id, second.id, False),
+                _review(session_id, first.id, True),
+            ]
+        },
+        headers=auth_headers(user_id=123),
+    )
+
+    assert response.status_code == 200
+    reviews = response.json()["reviews"]
+    assert [(r["blunder_id"], r["pass_streak"]) for r in reviews] == [
+        (first.id, 2),
+        (second.id, 0),
+        (first.id, 3),
+    ]
+
+    db_session.expire_all()
+    assert db_session.get(Blunder, first.id).pass_streak == 3
+    assert db_session.get(Blunder, second.id).pass_streak == 0
+    assert db_session.get(Blunder, second.id).last_reviewed_at is not None
+    review_count = db_session.execute(text("SELECT COUNT(*) FROM blunder_reviews")).scalar_one()
+    assert review_count == 3
+
+
+def test_srs_review_batch_rejects_other_users_blunder(client, auth_headers, create_game_session, db_session):
+    session_id = create_game_session(user_id=123, player_color="white")
+    mine = _create_blunder(db_session, user_id=123)
+    theirs = _create_blunder(db_session, user_id=999)
+
+    response = client.post(
+        "/api/srs/review-batch",
+        json={"reviews": [_review(session_id, mine.id, True), _review(session_id, theirs.id, True)]},
+        headers=auth_headers(user_id=123),
+    )
+
+    assert response.status_code == 404
+    review_count = db_session.execute(text("SELECT COUNT(*) FROM blunder_reviews")).scalar_one()
+    assert review_count == 0
+
+
+def test_srs_review_batch_forbidden_for_other_users_session(client, auth_headers, create_game_session, db_session):
+    session_id = create_game_session(user_id=999, player_color="white")
+    blunder = _create_blunder(db_session, user_id=123)
+
+    response = client.post(
+        "/api/srs/review-batch",
+        json={"reviews": [_review(session_id, blunder.id, True)]},
+        headers=auth_headers(user_id=123),
+    )
+
+    assert response.status_code == 403
+
+
+def test_srs_review_batch_rejects_empty_payload(client, auth_headers):
+    response = client.post("/api/srs/review-batch", json={"reviews": []}, headers=auth_headers(user_id=123))
+    assert response.status_code == 422
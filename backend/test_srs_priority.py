@@ -20,6 +20,7 @@ from app.srs_math import (
     BASE_INTERVAL_HOURS,
     BACKOFF_FACTOR,
     MAX_INTERVAL_HOURS,
+    calculate_priorities,
     calculate_priority,
     calculate_urgency,
     expected_interval_hours,
@@ -92,6 +93,10 @@ class TestExpectedInterval:
     def test_very_high_pass_streak_stays_capped(self):
         assert expected_interval_hours(100) == MAX_INTERVAL_HOURS
 
+    def test_huge_pass_streak_does_not_overflow(self):
+        # 2.0 ** 5000 would raise OverflowError
+        assert expected_interval_hours(5000) == MAX_INTERVAL_HOURS
+
     def test_negative_pass_streak_treated_as_zero(self):
         # max(-5, 0) = 0 → 4 * 2^0 = 4 hours
         assert expected_interval_hours(-5) == 4.0
@@ -165,6 +170,18 @@ class TestCalculatePriority:
         )
         assert priority == pytest.approx(2.0)
 
+    def test_batch_priorities(self):
+        rows = [
+            (0, NOW - timedelta(hours=4), None),
+            (3, None, NOW - timedelta(hours=16)),
+            (100, NOW - timedelta(days=400), None),
+            (2, NOW + timedelta(hours=1), None),
+            (0, None, None),
+        ]
+        assert calculate_priorities(rows, now=NOW) == pytest.approx(
+            [1.0, 0.5, 400 * 24 / 4320.0, 0.0, 0.0]
+        )
+
     def test_both_none_returns_zero(self):
         priority = calculate_priority(
             pass_streak=0, last_reviewed_at=None,
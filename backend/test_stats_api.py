@@ -1,6 +1,9 @@
 import uuid
 from datetime import datetime, timedelta, timezone
 
+from sqlalchemy import text, update
+
+from app.api import stats
 from app.models import Blunder, GameSession, Move, Position
 
 
@@ -29,29 +32,31 @@ def _set_session_times(
     started_at: datetime,
     ended_at: datetime | None,
 ):
-    session = db_session.query(GameSession).filter(GameSession.id == uuid.UUID(session_id)).first()
-    assert session is not None
-    session.started_at = started_at
-    session.ended_at = ended_at
+    result = db_session.execute(
+        update(GameSession)
+        .where(GameSession.id == uuid.UUID(session_id))
+        .values(started_at=started_at, ended_at=ended_at)
+    )
+    assert result.rowcount == 1
     db_session.commit()
 
 
 def _insert_library_data(db_session, *, user_id: int, now: datetime):
     p1 = Position(
         user_id=user_id,
-        fen_hash="hash-a",
+        fen_hash=b"hash-a",
         fen_raw="fen-a",
         active_color="white",
     )
     p2 = Position(
         user_id=user_id,
-        fen_hash="hash-b",
+        fen_hash=b"hash-b",
         fen_raw="fen-b",
         active_color="black",
     )
     p3 = Position(
         user_id=user_id,
-        fen_hash="hash-c",
+        fen_hash=b"hash-c",
         fen_raw="fen-c",
         active_color="white",
     )
@@ -338,13 +343,13 @@ def test_stats_summary_window_filtering(client, auth_headers, create_game_sessio
 
     p1 = Position(
         user_id=123,
-        fen_hash="window-h1",
+        fen_hash=b"window-h1",
         fen_raw="window-fen-1",
         active_color="white",
     )
     p2 = Position(
         user_id=123,
-        fen_hash="window-h2",
+        fen_hash=b"window-h2",
         fen_raw="window-fen-2",
         active_color="black",
     )
@@ -383,6 +388,7 @@ def test_stats_summary_window_filtering(client, auth_headers, create_game_sessio
     assert data_30["games"]["active"] == 1
     assert data_30["games"]["record"]["resigns"] == 1
     assert data_30["games"]["record"]["draws"] == 0
+    assert data_30["games"]["avg_duration_seconds"] == 1800
     assert data_30["library"]["blunders_total"] == 2
     assert data_30["library"]["new_blunders_in_window"] == 1
 
@@ -395,6 +401,7 @@ def test_stats_summary_window_filtering(client, auth_headers, create_game_sessio
     assert data_all["games"]["played"] == 3
     assert data_all["games"]["completed"] == 2
     assert data_all["games"]["record"]["draws"] == 1
+    assert data_all["games"]["avg_duration_seconds"] == 2700
     assert data_all["library"]["new_blunders_in_window"] == 2
 
 
@@ -418,3 +425,119 @@ def test_stats_summary_zero_denominator_with_sessions(client, auth_headers, crea
 def test_stats_summary_window_days_validation(client, auth_headers):
     response = client.get("/api/stats/summary?window_days=31", headers=auth_headers(user_id=123))
     assert response.status_code == 422
+
+
+def test_stats_summary_mv_flag_ignored_off_postgres(client, auth_headers, create_game_session, monkeypatch):
+    monkeypatch.setenv("STATS_SUMMARY_MV", "true")
+    session_id = create_game_session(user_id=123, player_color="white")
+    _end_game(client, auth_headers, session_id, user_id=123, result="checkmate_win")
+
+    response = client.get("/api/stats/summary", headers=auth_headers(user_id=123))
+    assert response.status_code == 200
+    assert response.json()["games"]["record"]["wins"] == 1
+
+
+def _move(move_number: int, color: str, san: str) -> dict:
+    return {
+        "move_number": move_number,
+        "color": color,
+        "move_san": san,
+        "fen_after": f"fen-{move_number}{color[0]}-{san}",
+        "eval_delta": 0,
+        "classification": "best",
+    }
+
+
+def test_stats_summary_mv_ratios_use_snapshot_sessions(
+    client, auth_headers, create_game_session, db_session, monkeypatch
+):
+    # Stand-in for the Postgres materialized view; rolled back with the test.
+    db_session.execute(
+        text(
+            "CREATE TABLE stats_session_summary_mv ("
+            "user_id INTEGER, window_days INTEGER, player_color TEXT, status TEXT, "
+            "result TEXT, games INTEGER, timed_games INTEGER, duration_seconds REAL, "
+            "generated_at DATETIME)"
+        )
+    )
+    monkeypatch.setattr(stats, "_use_stats_summary_mv", lambda db: True)
+    now = datetime.now(timezone.utc)
+    snapshot = now - timedelta(days=1)
+
+    counted = create_game_session(user_id=123, player_color="white")
+    _upload_moves(client, auth_headers, counted, [_move(1, "white", "e4"), _move(1, "black", "e5")])
+    _set_session_times(db_session, counted, started_at=now - timedelta(days=2), ended_at=None)
+    db_session.execute(
+        stats.stats_session_summary_mv.insert().values(
+            user_id=123,
+            window_days=30,
+            player_color="white",
+            status="ended",
+            result="checkmate_win",
+            games=1,
+            timed_games=1,
+            duration_seconds=600,
+            generated_at=snapshot,
+        )
+    )
+    db_session.commit()
+
+    # Started after the refresh: not in the snapshot, so its moves must not
+    # inflate the per-game ratios.
+    newer = create_game_session(user_id=123, player_color="white")
+    _upload_moves(
+        client,
+        auth_headers,
+        newer,
+        [_move(1, "white", "d4"), _move(1, "black", "d5"), _move(2, "white", "c4"), _move(2, "black", "e6")],
+    )
+
+    response = client.get("/api/stats/summary", headers=auth_headers(user_id=123))
+    assert response.status_code == 200
+    data = response.json()
+    assert data["games"]["played"] == 1
+    assert data["games"]["record"]["wins"] == 1
+    assert data["games"]["avg_moves"] == 2.0
+    assert data["moves"]["player_moves"] == 1
+    assert data["data_completeness"]["sessions_with_uploaded_moves_pct"] == 100.0
+
+
+def test_stats_summary_cached_until_game_write(client, auth_headers, create_game_session, db_session):
+    session_id = create_game_session(user_id=123, player_color="white")
+
+    first = client.get("/api/stats/summary", headers=auth_headers(user_id=123))
+    assert first.status_code == 200
+    # No browser caching: only the server-side cache, which writes invalidate.
+    assert "cache-control" not in first.headers
+    assert first.json()["games"]["active"] == 1
+
+    # Writes outside the API are not seen until the cached entry expires.
+    db_session.add(
+        GameSession(
+            id=uuid.uuid4(),
+            user_id=123,
+            started_at=datetime.now(timezone.utc),
+            status="active",
+            engine_elo=1500,
+            player_color="black",
+        )
+    )
+    db_session.commit()
+    cached = client.get("/api/stats/summary", headers=auth_headers(user_id=123))
+    assert cached.json() == first.json()
+
+    # Ending a game through the API invalidates the user's summaries.
+    _end_game(client, auth_headers, session_id, user_id=123, result="checkmate_win")
+    fresh = client.get("/api/stats/summary", headers=auth_headers(user_id=123))
+    assert fresh.json()["games"]["played"] == 2
+    assert fresh.json()["games"]["record"]["wins"] == 1
+
+
+def test_stats_summary_gzip_compressed(client, auth_headers):
+    response = client.get(
+        "/api/stats/summary",
+        headers={**auth_headers(user_id=123), "Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["window_days"] == 30